@@ -1,31 +1,56 @@
-from flask import Flask, jsonify
-from flask_cors import CORS
-from app.routes.recommend_routes import recommend_bp
-from app.database import init_db
+from app.utils import startup
 
-from werkzeug.exceptions import InternalServerError
-from sqlalchemy.exc import SQLAlchemyError
+import sys
+
+with startup.timed_phase('import_web_framework'):
+    from flask import Flask, jsonify
+    from flask_cors import CORS
+    from werkzeug.exceptions import InternalServerError
+
+with startup.timed_phase('import_routes'):
+    from app.routes.recommend_routes import recommend_bp
+    from app.routes.health_routes import health_bp
+
+from app.config import Config
+from app.utils.logging_setup import configure_logging
 
 def register_error_handlers(app):
-    @app.errorhandler(SQLAlchemyError)
+    # SQLAlchemy is only imported once something touches the database, so its
+    # errors are picked out of Flask's 500 handling instead of importing
+    # sqlalchemy.exc at startup. Flask has already logged the original error,
+    # and any other unhandled error keeps the default 500 response.
+    @app.errorhandler(InternalServerError)
     def handle_database_error(error):
-        app.logger.error(f"Database error: {str(error)}")
+        original = error.original_exception
+        sqlalchemy_exc = sys.modules.get('sqlalchemy.exc')
+        if sqlalchemy_exc is None or not isinstance(original, sqlalchemy_exc.SQLAlchemyError):
+            return error
+
         return jsonify({
             "error": "Database connection error",
-            "message": str(error)
+            "message": str(original)
         }), 500
 
 def create_app():
-    app = Flask(__name__)
-    CORS(app)
+    with startup.timed_phase('create_app'):
+        # Logging goes through a background thread so requests never block on stdout
+        configure_logging(Config.LOG_LEVEL, Config.LOG_SAMPLE_RATE, Config.LOG_QUEUE_SIZE)
+
+        app = Flask(__name__)
+        CORS(app)
+
+        # Initialize database
+        # from app.database import init_db
+        # init_db()
 
-    # Initialize database
-    # init_db()
+        # Register error handlers
+        register_error_handlers(app)
 
-    # Register error handlers
-    register_error_handlers(app)
+        # Register blueprints
+        app.register_blueprint(recommend_bp, url_prefix='/api')
+        app.register_blueprint(health_bp, url_prefix='/api')
 
-    # Register blueprints
-    app.register_blueprint(recommend_bp, url_prefix='/api')
+    # Warm up the recommender according to the configured startup mode
+    startup.start(Config.STARTUP_MODE)
 
-    return app
\ No newline at end of file
+    return app
@@ -11,4 +11,35 @@ class Config:
     # Database Pool Configuration
     SQLALCHEMY_POOL_SIZE = int(os.getenv("SQLALCHEMY_POOL_SIZE", 5))
     SQLALCHEMY_MAX_OVERFLOW = int(os.getenv("SQLALCHEMY_MAX_OVERFLOW", 10))
-    SQLALCHEMY_POOL_TIMEOUT = int(os.getenv("SQLALCHEMY_POOL_TIMEOUT", 30))
\ No newline at end of file
+    SQLALCHEMY_POOL_TIMEOUT = int(os.getenv("SQLALCHEMY_POOL_TIMEOUT", 30))
+
+    # Startup Configuration
+    # eager: warm up before serving, background: warm up in a thread, lazy: on first request
+    STARTUP_MODE = os.getenv("STARTUP_MODE", "background").lower()
+
+    # Recommender Configuration
+    # float64 (exact), float32 or int8 (scalar-quantized) job index
+    RECOMMENDER_PRECISION = os.getenv("RECOMMENDER_PRECISION", "float64").lower()
+
+    # Latency budget for /api/recommend in milliseconds, 0 disables degradation.
+    # Callers can override it per request with the X-Latency-Budget-Ms header.
+    RECOMMEND_BUDGET_MS = float(os.getenv("RECOMMEND_BUDGET_MS", 0))
+    CANDIDATE_POOL_SIZE = int(os.getenv("CANDIDATE_POOL_SIZE", 500))
+    APPROXIMATE_POOL_SIZE = int(os.getenv("APPROXIMATE_POOL_SIZE", 125))
+    RECOMMENDATION_CACHE_SIZE = int(os.getenv("RECOMMENDATION_CACHE_SIZE", 10000))
+
+    # Seconds between background rebuilds of the employee index used by /api/candidates
+    EMPLOYEE_INDEX_TTL_SECONDS = int(os.getenv("EMPLOYEE_INDEX_TTL_SECONDS", 300))
+
+    # Load database-backed lookups at startup instead of on their first request.
+    # Each one rescans its table periodically from then on, so both are opt-in.
+    PRELOAD_EMPLOYEE_INDEX = os.getenv("PRELOAD_EMPLOYEE_INDEX", "False").lower() == "true"
+    PRELOAD_EMPLOYEE_FEATURES = os.getenv("PRELOAD_EMPLOYEE_FEATURES", "False").lower() == "true"
+
+    # Seconds between background syncs of materialized employee features for /api/recommend by employeeId
+    EMPLOYEE_FEATURE_SYNC_SECONDS = int(os.getenv("EMPLOYEE_FEATURE_SYNC_SECONDS", 30))
+
+    # Logging Configuration
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+    LOG_SAMPLE_RATE = float(os.getenv("LOG_SAMPLE_RATE", 1.0))
+    LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", 10000))
@@ -0,0 +1,195 @@
+"""
+Offline bulk recommendation job
+
+Computes the top-N jobs for every employee in the database and writes them
+to the job_recommendation table. Employees are streamed in id order, scored
+chunk by chunk across a process pool and the last committed employee id is
+checkpointed, so an interrupted run resumes where it stopped.
+
+Usage:
+    python -m app.jobs.bulk_recommend --top-n 10 --chunk-size 500 --workers 4
+"""
+import argparse
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from sqlalchemy import select, delete, insert
+from sqlalchemy.orm import selectinload
+
+from app.database import SessionLocal, engine
+from app.models import JobRecommendation
+from app.models.job import Job
+from app.utils.job_matrix import JobMatrix
+from app.utils.model_features import flatten_job_model, stream_employee_chunks
+
+# Per-process state, populated once by the pool initializer
+_worker_state = {}
+
+def _init_worker(job_features, top_n):
+    _worker_state['job_matrix'] = JobMatrix(job_features)
+    _worker_state['top_n'] = top_n
+
+def _score_chunk(employees):
+    """
+    Score one chunk of flattened employees in a worker process
+
+    Returns:
+        list: (employee_id, [(job_id, similarity_score), ...]) per employee
+    """
+    batch = _worker_state['job_matrix'].recommend_batch(employees, k=_worker_state['top_n'])
+
+    return [
+        (employee['id'], [(rec['job']['id'], rec['similarity_score']) for rec in recommendations])
+        for employee, recommendations in zip(employees, batch)
+    ]
+
+def load_checkpoint(path):
+    """
+    Read the checkpoint file, if any
+
+    Returns:
+        dict: Checkpoint state with last_employee_id and employees_processed
+    """
+    if path and os.path.exists(path):
+        with open(path) as f:
+            return json.load(f)
+
+    return {'last_employee_id': 0, 'employees_processed': 0}
+
+def save_checkpoint(path, state):
+    """
+    Atomically write the checkpoint file
+    """
+    if not path:
+        return
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(state, f)
+    os.replace(tmp_path, path)
+
+def load_jobs(db):
+    jobs = db.scalars(
+        select(Job).options(selectinload(Job.job_skills)).order_by(Job.id)
+    ).all()
+
+    return [flatten_job_model(job) for job in jobs]
+
+def write_chunk(db, results):
+    """
+    Replace the stored recommendations of every employee in the chunk
+    """
+    employee_ids = [employee_id for employee_id, _ in results]
+    created_at = datetime.utcnow()
+
+    rows = [
+        {
+            'employee_id': employee_id,
+            'job_id': job_id,
+            'rank': rank,
+            'similarity_score': similarity_score,
+            'created_at': created_at
+        }
+        for employee_id, recommendations in results
+        for rank, (job_id, similarity_score) in enumerate(recommendations, start=1)
+    ]
+
+    db.execute(delete(JobRecommendation).where(JobRecommendation.employee_id.in_(employee_ids)))
+    if rows:
+        db.execute(insert(JobRecommendation), rows)
+    db.commit()
+
+def run(top_n=10, chunk_size=500, workers=None, checkpoint_path=None, reset=False):
+    """
+    Run the bulk recommendation pipeline
+
+    Args:
+        top_n (int): Recommendations stored per employee
+        chunk_size (int): Employees loaded and scored per chunk
+        workers (int): Scoring processes, defaults to the CPU count
+        checkpoint_path (str): Checkpoint file used to resume interrupted runs
+        reset (bool): Ignore any existing checkpoint and start from the first employee
+
+    Returns:
+        dict: Final checkpoint state
+    """
+    JobRecommendation.__table__.create(bind=engine, checkfirst=True)
+
+    state = {'last_employee_id': 0, 'employees_processed': 0} if reset else load_checkpoint(checkpoint_path)
+    workers = workers or os.cpu_count() or 1
+
+    db = SessionLocal()
+    try:
+        job_features = load_jobs(db)
+        print(f"Loaded {len(job_features)} jobs, resuming after employee {state['last_employee_id']}")
+
+        started_at = time.perf_counter()
+        processed_this_run = 0
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(job_features, top_n)
+        ) as pool:
+            # Chunks are written in submission order so the checkpoint only ever moves forward
+            in_flight = deque()
+
+            def drain_one():
+                nonlocal processed_this_run
+                last_employee_id, chunk_started_at, future = in_flight.popleft()
+                results = future.result()
+                write_chunk(db, results)
+
+                state['last_employee_id'] = last_employee_id
+                state['employees_processed'] += len(results)
+                save_checkpoint(checkpoint_path, state)
+
+                processed_this_run += len(results)
+                elapsed = time.perf_counter() - started_at
+                chunk_elapsed = time.perf_counter() - chunk_started_at
+                print(f"Processed {state['employees_processed']} employees (up to id {last_employee_id}): "
+                      f"chunk {len(results) / chunk_elapsed:.1f} employees/sec, "
+                      f"overall {processed_this_run / elapsed:.1f} employees/sec")
+
+            for chunk in stream_employee_chunks(db, state['last_employee_id'], chunk_size):
+                in_flight.append((chunk[-1]['id'], time.perf_counter(), pool.submit(_score_chunk, chunk)))
+
+                # Bound memory: at most two chunks queued per worker
+                while len(in_flight) >= workers * 2:
+                    drain_one()
+
+            while in_flight:
+                drain_one()
+
+        elapsed = time.perf_counter() - started_at
+        rate = processed_this_run / elapsed if elapsed > 0 else 0.0
+        print(f"Done: {processed_this_run} employees in {elapsed:.1f}s ({rate:.1f} employees/sec)")
+
+        return state
+    finally:
+        db.close()
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompute top-N job recommendations for every employee')
+    parser.add_argument('--top-n', type=int, default=10, help='Recommendations stored per employee')
+    parser.add_argument('--chunk-size', type=int, default=500, help='Employees loaded and scored per chunk')
+    parser.add_argument('--workers', type=int, default=None, help='Scoring processes (default: CPU count)')
+    parser.add_argument('--checkpoint', default='bulk_recommend.checkpoint.json',
+                        help='Checkpoint file used to resume an interrupted run')
+    parser.add_argument('--reset', action='store_true', help='Ignore the checkpoint and start over')
+    args = parser.parse_args()
+
+    run(
+        top_n=args.top_n,
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        checkpoint_path=args.checkpoint,
+        reset=args.reset
+    )
+
+if __name__ == '__main__':
+    main()
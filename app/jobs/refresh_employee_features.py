@@ -0,0 +1,262 @@
+"""
+Employee feature refresh job
+
+Keeps the employee_feature table in sync with employee career goals,
+skills and educations. The first run (or --full) materializes every
+employee. Later runs rebuild employees whose CareerGoal or EmployeeSkill
+rows have an updated_at past the stored watermark, plus employees whose
+stored row no longer matches a column-only reconciliation scan, which
+catches deleted rows and repointed career goals that leave no timestamp.
+
+Usage:
+    python -m app.jobs.refresh_employee_features [--full] [--interval 60]
+"""
+import argparse
+import time
+from datetime import timedelta
+
+from sqlalchemy import select, delete, insert, func, union
+from sqlalchemy.orm import selectinload
+
+from app.models import Employee, CareerGoal, EmployeeSkill, Education, EmployeeFeature
+from app.utils.model_features import flatten_employee_model, stream_employee_chunks
+
+# Rows committed slightly out of timestamp order are picked up by re-scanning this window;
+# re-materializing an employee is idempotent
+WATERMARK_OVERLAP = timedelta(seconds=5)
+
+def current_watermark(db):
+    """
+    Latest source watermark materialized so far. Falls back to the last write
+    time when no source row carried an updated_at, and is None only when the
+    store is empty.
+    """
+    return (
+        db.scalar(select(func.max(EmployeeFeature.source_updated_at))) or
+        db.scalar(select(func.max(EmployeeFeature.refreshed_at)))
+    )
+
+def source_watermark(db):
+    """
+    Latest updated_at across the CareerGoal and EmployeeSkill tables
+    """
+    timestamps = [
+        db.scalar(select(func.max(CareerGoal.updated_at))),
+        db.scalar(select(func.max(EmployeeSkill.updated_at)))
+    ]
+    timestamps = [timestamp for timestamp in timestamps if timestamp is not None]
+
+    return max(timestamps) if timestamps else None
+
+def changed_employee_ids(db, since):
+    """
+    Ids of employees whose career goal or skills changed after `since`
+    """
+    changed = union(
+        select(Employee.id)
+        .join(CareerGoal, Employee.career_goal_id == CareerGoal.id)
+        .where(CareerGoal.updated_at > since),
+        select(EmployeeSkill.employee_id)
+        .where(EmployeeSkill.updated_at > since)
+    )
+
+    return sorted(db.scalars(select(changed.subquery().c[0])).all())
+
+def _aggregate(owner_column, value_column):
+    """
+    Per-owner (count, sum) of a child table column
+    """
+    return (
+        select(owner_column.label('owner_id'), func.count().label('n'), func.sum(value_column).label('total'))
+        .group_by(owner_column)
+        .subquery()
+    )
+
+def stale_employee_ids(db):
+    """
+    Ids of employees whose stored row no longer matches their career goal,
+    skills or educations, or who have no stored row. Compares career goal
+    values and per-employee (count, sum) aggregates of the skill and education
+    ids, reading columns only.
+    """
+    skills = _aggregate(EmployeeSkill.employee_id, EmployeeSkill.skill_id)
+    educations = _aggregate(Education.employee_id, Education.education_level_id)
+
+    current = db.execute(
+        select(
+            Employee.id,
+            CareerGoal.industry_id,
+            CareerGoal.job_type_id,
+            CareerGoal.position_id,
+            CareerGoal.min_salary,
+            CareerGoal.max_salary,
+            func.coalesce(skills.c.n, 0),
+            func.coalesce(skills.c.total, 0),
+            func.coalesce(educations.c.n, 0),
+            func.coalesce(educations.c.total, 0)
+        )
+        .outerjoin(CareerGoal, Employee.career_goal_id == CareerGoal.id)
+        .outerjoin(skills, skills.c.owner_id == Employee.id)
+        .outerjoin(educations, educations.c.owner_id == Employee.id)
+    )
+
+    stored = {
+        row.employee_id: (
+            row.industry_id,
+            row.job_type_id,
+            row.position_id,
+            row.min_salary,
+            row.max_salary,
+            len(row.skill_ids or []),
+            sum(row.skill_ids or []),
+            len(row.education_level_ids or []),
+            sum(row.education_level_ids or [])
+        )
+        for row in db.execute(select(
+            EmployeeFeature.employee_id,
+            EmployeeFeature.industry_id,
+            EmployeeFeature.job_type_id,
+            EmployeeFeature.position_id,
+            EmployeeFeature.min_salary,
+            EmployeeFeature.max_salary,
+            EmployeeFeature.skill_ids,
+            EmployeeFeature.education_level_ids
+        ))
+    }
+
+    return sorted(row[0] for row in current if stored.get(row[0]) != tuple(row[1:]))
+
+def delete_removed_employees(db):
+    """
+    Drop stored rows of employees that no longer exist
+    """
+    db.execute(delete(EmployeeFeature).where(EmployeeFeature.employee_id.not_in(select(Employee.id))))
+    db.commit()
+
+def write_features(db, employees, watermark):
+    """
+    Replace the materialized rows of the given flattened employees
+    """
+    # Database clock, so refreshed_at is comparable with the source updated_at columns
+    refreshed_at = db.scalar(select(func.now()))
+
+    rows = [
+        {
+            'employee_id': employee['id'],
+            'industry_id': employee.get('industry_id'),
+            'job_type_id': employee.get('job_type_id'),
+            'position_id': employee.get('position_id'),
+            'min_salary': employee.get('min_salary'),
+            'max_salary': employee.get('max_salary'),
+            'skill_ids': employee.get('skill_ids', []),
+            'education_level_ids': employee.get('education_level_ids', []),
+            'source_updated_at': watermark,
+            'refreshed_at': refreshed_at
+        }
+        for employee in employees
+    ]
+
+    db.execute(delete(EmployeeFeature).where(EmployeeFeature.employee_id.in_([row['employee_id'] for row in rows])))
+    if rows:
+        db.execute(insert(EmployeeFeature), rows)
+    db.commit()
+
+def full_refresh(db, chunk_size=500):
+    """
+    Materialize every employee and drop rows of employees that no longer exist
+
+    Returns:
+        int: Number of employees written
+    """
+    watermark = source_watermark(db)
+    written = 0
+
+    for chunk in stream_employee_chunks(db, 0, chunk_size):
+        write_features(db, chunk, watermark)
+        written += len(chunk)
+
+    delete_removed_employees(db)
+
+    return written
+
+def rebuild_employees(db, employee_ids, watermark, chunk_size=500):
+    """
+    Materialize the given employees; ids of employees that no longer exist are skipped
+    """
+    for start in range(0, len(employee_ids), chunk_size):
+        employees = db.scalars(
+            select(Employee)
+            .where(Employee.id.in_(employee_ids[start:start + chunk_size]))
+            .options(
+                selectinload(Employee.career_goal),
+                selectinload(Employee.employee_skills),
+                selectinload(Employee.educations)
+            )
+        ).all()
+        chunk = [flatten_employee_model(employee) for employee in employees]
+        db.expunge_all()
+
+        write_features(db, chunk, watermark)
+
+def incremental_refresh(db, chunk_size=500):
+    """
+    Rebuild employees changed since the stored watermark or found stale by
+    the reconciliation scan, and drop rows of removed employees
+
+    Returns:
+        int: Number of employees written
+    """
+    since = current_watermark(db)
+    if since is None:
+        return full_refresh(db, chunk_size)
+
+    watermark = source_watermark(db) or since
+    employee_ids = sorted(
+        set(changed_employee_ids(db, since - WATERMARK_OVERLAP)) |
+        set(stale_employee_ids(db))
+    )
+
+    rebuild_employees(db, employee_ids, watermark, chunk_size)
+    delete_removed_employees(db)
+
+    return len(employee_ids)
+
+def run(full=False, chunk_size=500):
+    """
+    Run one refresh pass
+
+    Args:
+        full (bool): Rebuild every employee instead of only changed ones
+        chunk_size (int): Employees loaded and written per batch
+
+    Returns:
+        int: Number of employees written
+    """
+    from app.database import SessionLocal, engine
+
+    EmployeeFeature.__table__.create(bind=engine, checkfirst=True)
+
+    db = SessionLocal()
+    try:
+        started_at = time.perf_counter()
+        written = full_refresh(db, chunk_size) if full else incremental_refresh(db, chunk_size)
+        print(f"Refreshed {written} employee feature rows in {time.perf_counter() - started_at:.2f}s")
+        return written
+    finally:
+        db.close()
+
+def main():
+    parser = argparse.ArgumentParser(description='Refresh materialized employee feature vectors')
+    parser.add_argument('--full', action='store_true', help='Rebuild every employee')
+    parser.add_argument('--chunk-size', type=int, default=500, help='Employees loaded and written per batch')
+    parser.add_argument('--interval', type=int, default=0,
+                        help='Seconds between incremental passes; 0 runs once')
+    args = parser.parse_args()
+
+    run(full=args.full, chunk_size=args.chunk_size)
+    while args.interval > 0:
+        time.sleep(args.interval)
+        run(chunk_size=args.chunk_size)
+
+if __name__ == '__main__':
+    main()
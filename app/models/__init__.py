@@ -7,6 +7,8 @@ from .education import Education
 from .education_level import EducationLevel
 from .employee_skill import EmployeeSkill
 from .job_skill import JobSkill
+from .job_recommendation import JobRecommendation
+from .employee_feature import EmployeeFeature
 
 
-__all__ = ['Base', 'User', 'Employee', 'CareerGoal', 'Education', 'EducationLevel', 'EmployeeSkill', 'JobSkill']
\ No newline at end of file
+__all__ = ['Base', 'User', 'Employee', 'CareerGoal', 'Education', 'EducationLevel', 'EmployeeSkill', 'JobSkill', 'JobRecommendation', 'EmployeeFeature']
\ No newline at end of file
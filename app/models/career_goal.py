@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, func
+from sqlalchemy.orm import relationship, deferred
 from app.models.base import Base
 
 class CareerGoal(Base):
@@ -15,6 +15,10 @@ class CareerGoal(Base):
     position_id = Column(Integer)
     job_type_id = Column(Integer)
 
+    # Only read by the employee feature refresh; deferred so regular loads never select it.
+    # Writers outside this service are covered by the trigger in migration 0001.
+    updated_at = deferred(Column(DateTime, server_default=func.now(), onupdate=func.now(), index=True))
+
     def __repr__(self):
         return (f"<CareerGoal(id={self.id}, industry_id={self.industry_id}, "
                 f"position_id={self.position_id}, job_type_id={self.job_type_id}, "
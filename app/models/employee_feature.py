@@ -0,0 +1,49 @@
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, JSON
+from app.models.base import Base
+
+class EmployeeFeature(Base):
+    """
+    EmployeeFeature model storing an employee's materialized recommendation features
+    """
+    __tablename__ = 'employee_feature'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    employee_id = Column(Integer, ForeignKey('employee.id'), nullable=False, unique=True)
+
+    industry_id = Column(Integer)
+    job_type_id = Column(Integer)
+    position_id = Column(Integer)
+    min_salary = Column(Integer)
+    max_salary = Column(Integer)
+    skill_ids = Column(JSON)
+    education_level_ids = Column(JSON)
+
+    # Source watermark the row was built at, and when it was written
+    source_updated_at = Column(DateTime)
+    refreshed_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+
+    def as_features(self):
+        """
+        Return the row in the same shape as flatten_employee_data
+
+        Returns:
+            dict: Flattened employee dictionary
+        """
+        features = {
+            'id': self.employee_id,
+            'education_level_ids': self.education_level_ids,
+            'industry_id': self.industry_id,
+            'job_type_id': self.job_type_id,
+            'min_salary': self.min_salary,
+            'max_salary': self.max_salary,
+            'position_id': self.position_id,
+            'skill_ids': self.skill_ids
+        }
+
+        return {k: v for k, v in features.items() if v is not None and v != []}
+
+    def __repr__(self):
+        return (f"<EmployeeFeature(id={self.id}, employee_id={self.employee_id}, "
+                f"refreshed_at={self.refreshed_at})>")
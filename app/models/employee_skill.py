@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Date
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, ForeignKey, Date, DateTime, func
+from sqlalchemy.orm import relationship, deferred
 from app.models.base import Base
 
 class EmployeeSkill(Base):
@@ -7,4 +7,8 @@ class EmployeeSkill(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     employee_id = Column(Integer, ForeignKey('employee.id'), nullable=False)
-    skill_id = Column(Integer, ForeignKey('skill.id'), nullable=False)
\ No newline at end of file
+    skill_id = Column(Integer, ForeignKey('skill.id'), nullable=False)
+
+    # Only read by the employee feature refresh; deferred so regular loads never select it.
+    # Writers outside this service are covered by the trigger in migration 0001.
+    updated_at = deferred(Column(DateTime, server_default=func.now(), onupdate=func.now(), index=True))
\ No newline at end of file
@@ -0,0 +1,21 @@
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey
+from app.models.base import Base
+
+class JobRecommendation(Base):
+    """
+    JobRecommendation model storing precomputed top-N jobs for an employee
+    """
+    __tablename__ = 'job_recommendation'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    employee_id = Column(Integer, ForeignKey('employee.id'), nullable=False, index=True)
+    job_id = Column(Integer, ForeignKey('jobs.id'), nullable=False)
+    rank = Column(Integer, nullable=False)
+    similarity_score = Column(Float, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return (f"<JobRecommendation(id={self.id}, employee_id={self.employee_id}, "
+                f"job_id={self.job_id}, rank={self.rank}, similarity_score={self.similarity_score})>")
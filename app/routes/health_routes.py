@@ -0,0 +1,21 @@
+from flask import Blueprint
+
+from app.utils import startup
+from app.utils.metrics import metrics
+from app.utils.responses import json_response
+
+
+health_bp = Blueprint('health', __name__)
+
+@health_bp.route('/health', methods=['GET'])
+def liveness():
+    return json_response({'status': 'ok'}, 200)
+
+@health_bp.route('/ready', methods=['GET'])
+def readiness():
+    report = startup.startup_report()
+    return json_response(report, 200 if report['ready'] else 503)
+
+@health_bp.route('/metrics', methods=['GET'])
+def get_metrics():
+    return json_response(metrics.snapshot(), 200)
@@ -1,9 +1,19 @@
-from flask import Blueprint, abort, app, jsonify, request
-from app.utils.job_recommender import JobRecommender
+import logging
+import time
+
+from flask import Blueprint, abort, app, request
+from werkzeug.exceptions import HTTPException
+from app.config import Config
+from app.utils.degradation import get_degradation_ladder
+from app.utils.metrics import metrics
+from app.utils.responses import json_response
+from app.utils.startup import get_job_recommender_class
 
 
 recommend_bp = Blueprint('recommend', __name__)
 
+logger = logging.getLogger(__name__)
+
 def safe_get(obj, *keys, default=0):
     """
     Safely navigate nested dictionaries, handling None values
@@ -80,6 +90,59 @@ def flatten_job_data(jobs):
     
     return flattened_jobs
 
+def get_latency_budget_ms():
+    """
+    Resolve the request's latency budget from the X-Latency-Budget-Ms header or config
+    
+    Returns:
+        float: Budget in milliseconds, or None when no budget applies
+    
+    Raises:
+        ValueError: If the header is not a positive number
+    """
+    header = request.headers.get('X-Latency-Budget-Ms')
+    if header is None:
+        return Config.RECOMMEND_BUDGET_MS or None
+    
+    try:
+        budget_ms = float(header)
+    except ValueError:
+        budget_ms = 0
+    
+    if not budget_ms > 0:
+        raise ValueError('X-Latency-Budget-Ms must be a positive number')
+    
+    return budget_ms
+
+def parse_positive_int(value, name):
+    """
+    Parse a positive integer request field, accepting numeric strings
+    
+    Args:
+        value: Raw JSON value
+        name (str): Field name used in the error message
+    
+    Returns:
+        int: Parsed value
+    
+    Raises:
+        ValueError: If the value is not a positive integer
+    """
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    
+    try:
+        if isinstance(value, bool) or not isinstance(value, (int, str)):
+            raise ValueError
+        number = int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a positive integer") from None
+    
+    if number < 1:
+        raise ValueError(f"{name} must be a positive integer")
+    
+    return number
+
 def flatten_employee_data(employee):
     """
     Flatten employee data and remove None values
@@ -93,6 +156,7 @@ def flatten_employee_data(employee):
     career_goal = employee.get('careerGoal', {}) or {}
     
     flattened_employee = remove_none_values({
+        'id': employee.get('id'),
         'education_level_ids': employee.get('educationLevelIds', []),
         'industry_id': safe_get(career_goal, 'industryId') or safe_get(employee, 'industry', 'id'),
         'job_type_id': safe_get(career_goal, 'jobTypeId') or safe_get(employee, 'jobType', 'id'),
@@ -104,69 +168,230 @@ def flatten_employee_data(employee):
     
     return flattened_employee
 
+def finish_recommend_request(payload, status, path, started_at, budget_ms):
+    """
+    Record per-path metrics for a /recommend response and build it
+    
+    Args:
+        payload: JSON-serializable response body
+        status (int): HTTP status code
+        path (str): Degradation path taken, 'none' if the request never reached one
+        started_at (float): perf_counter value when the request started
+        budget_ms (float): Latency budget, None when no budget applies
+    
+    Returns:
+        Response: JSON response with the path and elapsed time headers
+    """
+    elapsed_ms = (time.perf_counter() - started_at) * 1000
+    
+    metrics.increment('recommend_requests_total', path=path, status=status)
+    metrics.observe('recommend_latency_ms', elapsed_ms, path=path)
+    if status >= 500:
+        metrics.increment('recommend_errors_total', path=path)
+    if budget_ms is not None and elapsed_ms > budget_ms:
+        metrics.increment('recommend_budget_exceeded_total', path=path)
+    
+    response = json_response(payload, status)
+    response.headers['X-Recommendation-Path'] = path
+    response.headers['X-Recommendation-Elapsed-Ms'] = f"{elapsed_ms:.1f}"
+    return response
+
 @recommend_bp.route('/recommend', methods=['POST'])
 def demonstrate_job_recommendation():
+    started_at = time.perf_counter()
+    budget_ms = None
+    path = 'none'
     try:
-        data = request.get_json()
+        try:
+            budget_ms = get_latency_budget_ms()
+        except ValueError as e:
+            return finish_recommend_request({'error': str(e)}, 400, path, started_at, None)
         
-        if not data or 'jobs' not in data or 'employee' not in data:
-            return jsonify({'error': 'Invalid input'}), 400
+        # Malformed JSON and other content types are client errors, not failures
+        data = request.get_json(silent=True)
         
-        recommender = JobRecommender(
-            flatten_employee_data(data['employee']), 
-            flatten_job_data(data['jobs'])
-        )
+        if not isinstance(data, dict) or 'jobs' not in data or ('employee' not in data and 'employeeId' not in data):
+            return finish_recommend_request({'error': 'Invalid input'}, 400, path, started_at, budget_ms)
+        
+        # Employees already in the database are served from the materialized store
+        if 'employee' in data:
+            employee_features = flatten_employee_data(data['employee'])
+        else:
+            try:
+                employee_id = parse_positive_int(data['employeeId'], 'employeeId')
+            except ValueError as e:
+                return finish_recommend_request({'error': str(e)}, 400, path, started_at, budget_ms)
+            
+            if not Config.DATABASE_URL:
+                return finish_recommend_request(
+                    {'error': 'Looking up employees by id needs a configured database'}, 501, path, started_at, budget_ms
+                )
+            
+            from app.utils.employee_feature_store import get_employee_feature_store
+            feature_store = get_employee_feature_store()
+            if not feature_store.is_loaded:
+                return finish_recommend_request(
+                    {'error': 'Employee features are still loading, retry shortly'}, 503, path, started_at, budget_ms
+                )
+            if len(feature_store) == 0:
+                return finish_recommend_request(
+                    {'error': 'Employee features are not materialized yet, run app.jobs.refresh_employee_features'},
+                    503, path, started_at, budget_ms
+                )
+            
+            employee_features = feature_store.get(employee_id)
+            if employee_features is None:
+                return finish_recommend_request(
+                    {'error': f"Employee {employee_id} not found"}, 404, path, started_at, budget_ms
+                )
+        
+        job_features = flatten_job_data(data['jobs'])
 
         # print(flatten_employee_data(data['employee']))
         # print(flatten_job_data(data['jobs']))
         
-        recommended_jobs = recommender.recommend_jobs(k=4)
+        # Time spent parsing the payload counts against the budget
+        remaining_ms = None
+        if budget_ms is not None:
+            remaining_ms = max(budget_ms - (time.perf_counter() - started_at) * 1000, 0)
         
-        job_list_ids = []
-        for rec in recommended_jobs:
-            job_list_ids.append({
-                'jobId' : rec['job']['id'],
-                'similarityScore' : rec['similarity_score']
-            })
-            
-            print(f"Similarity Score: {rec['similarity_score']:.2f}\n")
-        return jsonify(job_list_ids), 200;
+        # Choose the path up front so a failure is still counted against it
+        ladder = get_degradation_ladder()
+        path = ladder.choose_path(len(job_features), remaining_ms)
+        recommended_jobs, path = ladder.recommend(
+            employee_features,
+            job_features,
+            k=4,
+            budget_ms=remaining_ms,
+            path=path
+        )
+        
+        job_list_ids = [
+            {
+                'jobId': rec['job']['id'],
+                'similarityScore': rec['similarity_score']
+            }
+            for rec in recommended_jobs
+        ]
+
+        # One record per request, thinned by LOG_SAMPLE_RATE; scores only at DEBUG
+        log_fields = {
+            'route': '/recommend',
+            'path': path,
+            'budget_ms': budget_ms,
+            'elapsed_ms': round((time.perf_counter() - started_at) * 1000, 2),
+            'job_count': len(data['jobs'])
+        }
+        if logger.isEnabledFor(logging.DEBUG):
+            log_fields['similarity_scores'] = [round(rec['similarity_score'], 2) for rec in recommended_jobs]
+        logger.info('recommendations computed', extra=log_fields)
+        
+        return finish_recommend_request(job_list_ids, 200, path, started_at, budget_ms)
+    
+    except HTTPException:
+        raise
     
     except Exception as e:
-        print(f"An error occurred: {e}")
-        return jsonify({'error': str(e)}), 200
+        logger.exception('recommendation failed', extra={'route': '/recommend', 'path': path})
+        return finish_recommend_request({'error': str(e)}, 500, path, started_at, budget_ms)
     
 @recommend_bp.route('/similar', methods=['POST'])
 def get_similar_jobs():
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True)
         
-        if not data or 'jobs' not in data or 'jobId' not in data:
-            return jsonify({'error': 'Invalid input'}), 400
+        if not isinstance(data, dict) or 'jobs' not in data or 'jobId' not in data:
+            return json_response({'error': 'Invalid input'}, 400)
         
+        JobRecommender = get_job_recommender_class()
+        job_features = flatten_job_data(data['jobs'])
         recommender = JobRecommender(
             {},
-            flatten_job_data(data['jobs'])
+            job_features,
+            precision=Config.RECOMMENDER_PRECISION
         )
-
-        print('/similar')
-        print(flatten_job_data(data['jobs']))
         
         similar_jobs = recommender.recommend_similar_jobs(
             job_id=data['jobId'], 
             k=5
         )
         
-        job_list_ids = []
-        for rec in similar_jobs:
-            job_list_ids.append({
+        job_list_ids = [
+            {
                 'jobId': rec['job']['id'],
                 'similarityScore': rec['similarity_score']
-            })
-            print(f"Similarity Score: {rec['similarity_score']:.2f}\n")
+            }
+            for rec in similar_jobs
+        ]
+
+        log_fields = {
+            'route': '/similar',
+            'job_id': data['jobId'],
+            'job_count': len(job_features)
+        }
+        if logger.isEnabledFor(logging.DEBUG):
+            log_fields['similarity_scores'] = [round(rec['similarity_score'], 2) for rec in similar_jobs]
+        logger.info('similar jobs computed', extra=log_fields)
+        return json_response(job_list_ids, 200)
+    
+    except Exception as e:
+        logger.exception('similar jobs failed', extra={'route': '/similar'})
+        return json_response({'error': str(e)}, 400)
+
+@recommend_bp.route('/candidates', methods=['POST'])
+def get_candidates():
+    try:
+        data = request.get_json(silent=True)
         
-        return jsonify(job_list_ids), 200
+        if not isinstance(data, dict) or 'job' not in data:
+            return json_response({'error': 'Invalid input'}, 400)
+        
+        job_features = flatten_job_data([data['job']])
+        if not job_features or not isinstance(data.get('employees', []), list):
+            return json_response({'error': 'Invalid input'}, 400)
+        
+        try:
+            k = parse_positive_int(data.get('k', 10), 'k')
+        except ValueError as e:
+            return json_response({'error': str(e)}, 400)
+        
+        # Rank posted profiles when given, otherwise every employee in the database
+        if 'employees' in data:
+            from app.utils.employee_index import EmployeeIndex
+            employee_index = EmployeeIndex([
+                flatten_employee_data(employee)
+                for employee in data['employees']
+                if employee is not None
+            ])
+        else:
+            if not Config.DATABASE_URL:
+                return json_response({'error': 'Ranking stored employees needs a configured database'}, 501)
+            
+            from app.utils.employee_index import get_database_employee_index
+            employee_index = get_database_employee_index(Config.EMPLOYEE_INDEX_TTL_SECONDS)
+            if employee_index is None:
+                return json_response({'error': 'Employee index is still loading, retry shortly'}, 503)
+        
+        candidates = employee_index.top_candidates(job_features[0], k=k)
+        
+        candidate_list_ids = [
+            {
+                'employeeId': candidate['employee_id'],
+                'similarityScore': candidate['similarity_score']
+            }
+            for candidate in candidates
+        ]
+
+        log_fields = {
+            'route': '/candidates',
+            'job_id': job_features[0].get('id'),
+            'employee_count': len(employee_index)
+        }
+        if logger.isEnabledFor(logging.DEBUG):
+            log_fields['similarity_scores'] = [round(candidate['similarity_score'], 2) for candidate in candidates]
+        logger.info('candidates computed', extra=log_fields)
+        return json_response(candidate_list_ids, 200)
     
     except Exception as e:
-        print(f"An error occurred: {e}")
-        return jsonify({'error': str(e)}), 400
\ No newline at end of file
+        logger.exception('candidates failed', extra={'route': '/candidates'})
+        return json_response({'error': str(e)}, 500)
@@ -0,0 +1,256 @@
+import json
+import threading
+import time
+from collections import Counter, OrderedDict
+from itertools import chain, repeat
+
+# Degradation ladder, most to least expensive
+PATHS = ('exact', 'candidate_pool', 'approximate', 'fallback')
+
+class DegradationLadder:
+    def __init__(self, recommender_cls, precision='float64', candidate_pool_size=500,
+                 approximate_pool_size=125, cache_size=10000, popular_size=1000,
+                 safety_factor=0.8):
+        """
+        Pick the most accurate recommendation path that fits a latency budget
+
+        Paths:
+            exact: score the full catalogue
+            candidate_pool: score only the jobs a cheap prefilter ranks highest
+            approximate: score a smaller prefiltered pool
+            fallback: this employee's cached result, else the most recommended jobs
+
+        Args:
+            recommender_cls (type): JobRecommender class
+            precision (str): Job index precision used by every scoring path
+            candidate_pool_size (int): Jobs scored by the candidate_pool path
+            approximate_pool_size (int): Jobs scored by the approximate path
+            cache_size (int): Employees whose last result is kept for the fallback
+            popular_size (int): Most recommended jobs kept for the fallback
+            safety_factor (float): Share of the remaining budget a path may be estimated to use
+        """
+        self.recommender_cls = recommender_cls
+        self.precision = precision
+        self.candidate_pool_size = candidate_pool_size
+        self.approximate_pool_size = approximate_pool_size
+        self.cache_size = cache_size
+        self.popular_size = popular_size
+        self.safety_factor = safety_factor
+
+        # Observed milliseconds per job, seeded from a 20k-job catalogue and updated as an EWMA
+        self._ms_per_job = {
+            'exact': 0.015,
+            'candidate_pool': 0.015,
+            'approximate': 0.02,
+            'prefilter': 0.0007
+        }
+        self._ewma_alpha = 0.2
+
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()
+        self._popular = Counter()
+
+    def estimate_ms(self, path, job_count):
+        """
+        Estimate the duration of a path for a catalogue of the given size
+        """
+        if path == 'fallback':
+            return 0.0
+
+        with self._lock:
+            ms_per_job = dict(self._ms_per_job)
+
+        if path == 'exact':
+            return ms_per_job['exact'] * job_count
+
+        pool_size = self.candidate_pool_size if path == 'candidate_pool' else self.approximate_pool_size
+        return ms_per_job['prefilter'] * job_count + ms_per_job[path] * min(job_count, pool_size)
+
+    def choose_path(self, job_count, budget_ms=None):
+        """
+        Return the first path on the ladder whose estimate fits the budget
+
+        Args:
+            job_count (int): Catalogue size
+            budget_ms (float): Remaining latency budget, None for no limit
+        """
+        if budget_ms is None:
+            return 'exact'
+
+        for path in PATHS[:-1]:
+            if self.estimate_ms(path, job_count) <= budget_ms * self.safety_factor:
+                return path
+
+        return 'fallback'
+
+    def _record_cost(self, key, elapsed_ms, job_count):
+        if job_count <= 0:
+            return
+
+        with self._lock:
+            previous = self._ms_per_job[key]
+            self._ms_per_job[key] = (1 - self._ewma_alpha) * previous + self._ewma_alpha * (elapsed_ms / job_count)
+
+    def _prefilter(self, employee_features, job_features, pool_size):
+        """
+        Keep the jobs sharing the most skills and career goal attributes with the
+        employee, best first and in catalogue order among equals
+        """
+        # numpy is only needed once a request degrades; keep it off the import path
+        import numpy as np
+
+        started_at = time.perf_counter()
+        job_count = len(job_features)
+
+        # Flatten the jobs' skills into one array with a parallel job row array;
+        # map(dict.get, ...) reads every job without a Python-level call per job
+        skill_lists = list(map(dict.get, job_features, repeat('skill_ids', job_count), repeat((), job_count)))
+        lengths = np.fromiter(map(len, skill_lists), dtype=np.intp, count=job_count)
+        skills = np.fromiter(chain.from_iterable(skill_lists), dtype=np.int64, count=int(lengths.sum()))
+        rows = np.repeat(np.arange(job_count), lengths)
+
+        # Distinct shared skills per job
+        employee_skills = np.array(sorted(set(employee_features.get('skill_ids', []))), dtype=np.int64)
+        shared = np.isin(skills, employee_skills)
+        shared_pairs = np.unique(np.stack([rows[shared], skills[shared]]), axis=1)
+        affinity = np.bincount(shared_pairs[0], minlength=job_count)
+
+        # Plus one per matching career goal attribute
+        for feature in ('industry_id', 'position_id', 'job_type_id'):
+            if feature in employee_features:
+                # Missing attributes become NaN and never match
+                values = np.array(list(map(dict.get, job_features, repeat(feature, job_count))), dtype=np.float64)
+                affinity += values == employee_features[feature]
+
+        # Unique keys: higher affinity first, then earlier in the catalogue
+        keys = affinity.astype(np.int64) * job_count + (job_count - 1 - np.arange(job_count))
+        top = np.argpartition(-keys, pool_size - 1)[:pool_size]
+        top = top[np.argsort(-keys[top])]
+
+        pool = [job_features[idx] for idx in top]
+
+        self._record_cost('prefilter', (time.perf_counter() - started_at) * 1000, job_count)
+
+        return pool
+
+    @staticmethod
+    def _cache_key(employee_features):
+        return json.dumps(employee_features, sort_keys=True, default=str)
+
+    def _remember(self, employee_features, recommendations):
+        entries = [(rec['job']['id'], rec['similarity_score']) for rec in recommendations]
+
+        with self._lock:
+            key = self._cache_key(employee_features)
+            self._cache[key] = entries
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+            self._popular.update(job_id for job_id, _ in entries)
+
+            # Keep the counter bounded; pruning to the top popular_size is amortized
+            # over the popular_size new job ids it takes to overflow again
+            if len(self._popular) > 2 * self.popular_size:
+                self._popular = Counter(dict(self._popular.most_common(self.popular_size)))
+
+    def _fallback(self, employee_features, job_features, k):
+        """
+        Serve this employee's cached result, else the most recommended jobs,
+        limited to jobs present in the current catalogue
+        """
+        jobs_by_id = {job['id']: job for job in job_features}
+
+        # Only a few times k popular jobs are needed, some may be missing from this catalogue
+        popular_count = min(max(k, 1) * 10, self.popular_size)
+
+        with self._lock:
+            cached = self._cache.get(self._cache_key(employee_features))
+            popular = [job_id for job_id, _ in self._popular.most_common(popular_count)] if cached is None else []
+
+        if cached is not None:
+            entries = [(job_id, score) for job_id, score in cached if job_id in jobs_by_id]
+        else:
+            entries = [(job_id, 0.0) for job_id in popular if job_id in jobs_by_id]
+
+        # Pad with catalogue order when nothing better is known
+        seen = {job_id for job_id, _ in entries}
+        for job in job_features:
+            if len(entries) >= k:
+                break
+            if job['id'] not in seen:
+                entries.append((job['id'], 0.0))
+
+        return [
+            {'job': jobs_by_id[job_id], 'similarity_score': float(score)}
+            for job_id, score in entries[:k]
+        ]
+
+    def recommend(self, employee_features, job_features, k=5, budget_ms=None, path=None):
+        """
+        Recommend jobs along the most accurate path that fits the budget
+
+        Args:
+            employee_features (dict): Flattened employee dictionary
+            job_features (list): Flattened job dictionaries
+            k (int): Number of job recommendations
+            budget_ms (float): Remaining latency budget, None for no limit
+            path (str): Path already picked with choose_path, picked here when None
+
+        Returns:
+            tuple: (recommendations, path taken)
+        """
+        deadline = time.perf_counter() + budget_ms / 1000 if budget_ms is not None else None
+        if path is None:
+            path = self.choose_path(len(job_features), budget_ms)
+
+        if not job_features or k <= 0:
+            return [], path
+
+        if path == 'fallback':
+            return self._fallback(employee_features, job_features, k), path
+
+        candidates = job_features
+        if path in ('candidate_pool', 'approximate'):
+            pool_size = self.candidate_pool_size if path == 'candidate_pool' else self.approximate_pool_size
+            if len(job_features) > max(pool_size, k):
+                candidates = self._prefilter(employee_features, job_features, max(pool_size, k))
+
+            # The prefilter alone may have used up the budget
+            if deadline is not None and time.perf_counter() >= deadline:
+                return self._fallback(employee_features, job_features, k), 'fallback'
+
+        started_at = time.perf_counter()
+        recommender = self.recommender_cls(employee_features, candidates, precision=self.precision)
+        # Catalogues smaller than k return every job instead of failing the KNN search
+        recommendations = recommender.recommend_jobs(k=min(k, len(candidates)))
+        self._record_cost(path, (time.perf_counter() - started_at) * 1000, len(candidates))
+
+        self._remember(employee_features, recommendations)
+
+        return recommendations, path
+
+_ladder = None
+_ladder_lock = threading.Lock()
+
+def get_degradation_ladder():
+    """
+    Build the process-wide ladder on first use, importing the recommender lazily
+    """
+    global _ladder
+
+    if _ladder is None:
+        with _ladder_lock:
+            if _ladder is None:
+                from app.config import Config
+                from app.utils.startup import get_job_recommender_class
+
+                _ladder = DegradationLadder(
+                    get_job_recommender_class(),
+                    precision=Config.RECOMMENDER_PRECISION,
+                    candidate_pool_size=Config.CANDIDATE_POOL_SIZE,
+                    approximate_pool_size=Config.APPROXIMATE_POOL_SIZE,
+                    cache_size=Config.RECOMMENDATION_CACHE_SIZE
+                )
+
+    return _ladder
@@ -0,0 +1,128 @@
+import threading
+from datetime import timedelta
+
+from app.utils.periodic_refresh import PeriodicRefresh
+
+# Re-read rows written within this window of the last sync, in case they committed late
+_SYNC_OVERLAP = timedelta(seconds=5)
+
+class EmployeeFeatureStore:
+    def __init__(self, session_factory, sync_interval_seconds=30):
+        """
+        In-process copy of the employee_feature table, keyed by employee id.
+        A background thread syncs it and swaps in a new mapping, so lookups
+        never wait on the database.
+
+        Args:
+            session_factory (callable): Returns a new database session
+            sync_interval_seconds (int): Seconds between incremental syncs
+        """
+        self.session_factory = session_factory
+        self.sync_interval_seconds = sync_interval_seconds
+
+        self._features = {}
+        self._synced_through = None
+        self._refresh = PeriodicRefresh('employee-features', self.sync, sync_interval_seconds)
+
+    def __len__(self):
+        return len(self._features)
+
+    @property
+    def is_loaded(self):
+        return self._refresh.is_loaded
+
+    def start(self):
+        """
+        Start the background sync thread; later calls do nothing
+
+        Returns:
+            EmployeeFeatureStore: self
+        """
+        self._refresh.start()
+        return self
+
+    def refresh(self):
+        """
+        Sync once in the calling thread and mark the store loaded
+        """
+        self._refresh.refresh()
+
+    def sync(self):
+        """
+        Load rows refreshed since the last sync, drop rows that no longer exist
+        and swap the new mapping in. Called from the sync thread only.
+
+        Returns:
+            int: Number of rows loaded
+        """
+        from sqlalchemy import select
+        from app.models import EmployeeFeature
+
+        incremental = self._synced_through is not None
+
+        query = select(EmployeeFeature)
+        if incremental:
+            query = query.where(EmployeeFeature.refreshed_at > self._synced_through - _SYNC_OVERLAP)
+
+        db = self.session_factory()
+        try:
+            if not incremental:
+                # The refresh job may not have run yet; an empty table reads as an empty store
+                EmployeeFeature.__table__.create(bind=db.connection(), checkfirst=True)
+                db.commit()
+
+            rows = db.scalars(query).all()
+            loaded = {row.employee_id: row.as_features() for row in rows}
+            synced_through = max((row.refreshed_at for row in rows), default=self._synced_through)
+
+            # A full refresh deletes rows of removed employees, which a refreshed_at scan cannot see
+            current_ids = set(db.scalars(select(EmployeeFeature.employee_id)).all()) if incremental else None
+        finally:
+            db.close()
+
+        if incremental:
+            features = {
+                employee_id: employee_features
+                for employee_id, employee_features in self._features.items()
+                if employee_id in current_ids
+            }
+            features.update(loaded)
+        else:
+            features = loaded
+
+        self._features = features
+        self._synced_through = synced_through
+
+        return len(loaded)
+
+    def get(self, employee_id):
+        """
+        Return the materialized features of an employee
+
+        Args:
+            employee_id (int): Employee id
+
+        Returns:
+            dict: Flattened employee dictionary, or None if not materialized
+        """
+        return self._features.get(employee_id)
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_employee_feature_store():
+    """
+    Build the process-wide store and start its sync thread on first use,
+    importing the database stack lazily
+    """
+    global _store
+
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                from app.config import Config
+                from app.database import SessionLocal
+
+                _store = EmployeeFeatureStore(SessionLocal, Config.EMPLOYEE_FEATURE_SYNC_SECONDS).start()
+
+    return _store
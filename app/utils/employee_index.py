@@ -0,0 +1,190 @@
+import threading
+
+import numpy as np
+from scipy import sparse
+
+from app.utils.job_matrix import safe_scale, salary_compatibility_matrix, skill_match_matrix
+from app.utils.periodic_refresh import PeriodicRefresh
+
+# Career goal attributes shared by jobs and employees
+CANDIDATE_FEATURES = [
+    'job_type_id',
+    'position_id',
+    'industry_id'
+]
+
+class EmployeeIndex:
+    def __init__(self, employee_features):
+        """
+        Columnar employee-side index for ranking candidates against a job
+
+        Args:
+            employee_features (list): List of flattened employee dictionaries with an 'id'
+        """
+        self.employee_ids = np.array([employee.get('id') for employee in employee_features], dtype=object)
+
+        static = np.array(
+            [[employee.get(feature, 0.0) for feature in CANDIDATE_FEATURES] for employee in employee_features],
+            dtype=np.float64
+        ).reshape(len(employee_features), len(CANDIDATE_FEATURES))
+
+        self.static_mean = static.mean(axis=0) if len(employee_features) else np.zeros(len(CANDIDATE_FEATURES))
+        self.static_scale = safe_scale(static.std(axis=0)) if len(employee_features) else np.ones(len(CANDIDATE_FEATURES))
+        self.static_scaled = (static - self.static_mean) / self.static_scale
+
+        self.min_salary = np.array([employee.get('min_salary') or 0.0 for employee in employee_features], dtype=np.float64)
+        self.max_salary = np.array([employee.get('max_salary') or np.inf for employee in employee_features], dtype=np.float64)
+
+        # Sparse employee x skill matrix over the population's skill vocabulary
+        self.skill_index = {}
+        rows, cols = [], []
+        self.skill_set_sizes = np.zeros(len(employee_features))
+        self.skill_list_sizes = np.zeros(len(employee_features))
+        for row, employee in enumerate(employee_features):
+            skills = employee.get('skill_ids', [])
+            self.skill_set_sizes[row] = len(set(skills))
+            self.skill_list_sizes[row] = len(skills)
+            for skill_id in set(skills):
+                rows.append(row)
+                cols.append(self.skill_index.setdefault(skill_id, len(self.skill_index)))
+
+        self.skill_matrix = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, cols)),
+            shape=(len(employee_features), len(self.skill_index))
+        )
+
+    def __len__(self):
+        return len(self.employee_ids)
+
+    def _job_skill_vector(self, job):
+        skills = set(job.get('skill_ids', []))
+        cols = [self.skill_index[skill_id] for skill_id in skills if skill_id in self.skill_index]
+
+        vector = sparse.csr_matrix(
+            (np.ones(len(cols)), ([0] * len(cols), cols)),
+            shape=(1, len(self.skill_index))
+        )
+
+        return vector, np.array([len(skills)], dtype=np.float64)
+
+    def score(self, job):
+        """
+        Score every employee against one job in a single vectorized pass
+
+        Args:
+            job (dict): Flattened job dictionary
+
+        Returns:
+            tuple: (E,) arrays of distances, skill matches and salary compatibilities
+        """
+        job_static = np.array([job.get(feature, 0.0) for feature in CANDIDATE_FEATURES], dtype=np.float64)
+        diff = self.static_scaled - (job_static - self.static_mean) / self.static_scale
+        distances = np.sqrt(np.einsum('ij,ij->i', diff, diff))
+
+        # Same employee-relative scores as the employee -> jobs direction
+        salary_compatibility = salary_compatibility_matrix(
+            self.min_salary,
+            self.max_salary,
+            np.array([job.get('min_salary', 0) or 0.0], dtype=np.float64),
+            np.array([job.get('max_salary', 0) or np.inf], dtype=np.float64)
+        )[:, 0]
+
+        job_skills, job_set_size = self._job_skill_vector(job)
+        skill_match = skill_match_matrix(
+            self.skill_matrix, self.skill_set_sizes, self.skill_list_sizes,
+            job_skills, job_set_size
+        )[:, 0]
+
+        return distances, skill_match, salary_compatibility
+
+    def top_candidates(self, job, k=10):
+        """
+        Rank the best candidate employees for a job
+
+        Args:
+            job (dict): Flattened job dictionary
+            k (int): Number of candidates
+
+        Returns:
+            list: Top K candidates with similarity scores, best first
+        """
+        k = min(k, len(self))
+        if k <= 0:
+            return []
+
+        distances, skill_match, salary_compatibility = self.score(job)
+
+        # Same weighting as JobRecommender.recommend_jobs
+        weighted_similarity = (
+            0.5 * (1 / (1 + distances)) +
+            0.3 * skill_match +
+            0.2 * salary_compatibility
+        )
+
+        top = np.argpartition(-weighted_similarity, k - 1)[:k]
+        top = top[np.argsort(-weighted_similarity[top], kind='stable')]
+
+        return [
+            {
+                'employee_id': self.employee_ids[idx],
+                'similarity_score': float(weighted_similarity[idx]),
+                'skill_match': float(skill_match[idx]),
+                'salary_compatibility': float(salary_compatibility[idx]),
+                'distance': float(distances[idx])
+            }
+            for idx in top
+        ]
+
+def load_database_employee_index(chunk_size=1000):
+    """
+    Build the employee index for every employee in the database
+
+    Args:
+        chunk_size (int): Employees loaded per query
+
+    Returns:
+        EmployeeIndex: Index over all employees
+    """
+    # Only callers that rank stored employees need the database stack
+    from app.database import SessionLocal
+    from app.utils.model_features import stream_employee_chunks
+
+    db = SessionLocal()
+    try:
+        employees = [
+            employee
+            for chunk in stream_employee_chunks(db, 0, chunk_size)
+            for employee in chunk
+        ]
+    finally:
+        db.close()
+
+    return EmployeeIndex(employees)
+
+_database_index_refresh = None
+_database_index_refresh_lock = threading.Lock()
+
+def get_database_employee_index(ttl_seconds=300):
+    """
+    Return the employee index over every employee in the database. The index is
+    rebuilt every ttl_seconds in a background thread, started on first use, and
+    swapped in whole, so callers never wait on a database scan.
+
+    Args:
+        ttl_seconds (int): Seconds between rebuilds
+
+    Returns:
+        EmployeeIndex: Latest index, None until the first build completes
+    """
+    global _database_index_refresh
+
+    if _database_index_refresh is None:
+        with _database_index_refresh_lock:
+            if _database_index_refresh is None:
+                _database_index_refresh = PeriodicRefresh(
+                    'employee-index',
+                    load_database_employee_index,
+                    ttl_seconds
+                ).start()
+
+    return _database_index_refresh.value
@@ -0,0 +1,161 @@
+import time
+
+import numpy as np
+from sklearn.neighbors import NearestNeighbors
+
+PRECISIONS = ('float64', 'float32', 'int8')
+
+# int8 rows are widened to float32 this many at a time, so a query only ever
+# holds a small cache-sized float32 block instead of a copy of the whole matrix
+INT8_BLOCK_ROWS = 16384
+
+def _quantization_scale(features):
+    """
+    Per-feature scale mapping the largest absolute value onto the int8 range
+
+    Args:
+        features (ndarray): (N, D) feature matrix
+
+    Returns:
+        ndarray: (D,) float32 scales, 1 for all-zero features
+    """
+    max_abs = np.abs(features).max(axis=0) if len(features) else np.zeros(features.shape[1])
+    return np.where(max_abs > 0, max_abs / 127, 1.0).astype(np.float32)
+
+class JobIndex:
+    def __init__(self, features, precision='float64'):
+        """
+        Nearest-neighbour index over a normalized job feature matrix
+
+        Args:
+            features (array-like): (N, D) normalized job features
+            precision (str): 'float64' (exact, scikit-learn KNN),
+                             'float32', or 'int8' (per-feature scalar quantization)
+        """
+        if precision not in PRECISIONS:
+            raise ValueError(f"Unknown precision '{precision}', expected one of {PRECISIONS}")
+
+        self.precision = precision
+        features = np.asarray(features)
+        self.n_samples = len(features)
+
+        if precision == 'float64':
+            self.matrix = features.astype(np.float64, copy=False)
+            self.scale = None
+            # Fit here so building and querying are timed alike for every precision
+            self._knn = NearestNeighbors(metric='euclidean').fit(self.matrix) if self.n_samples else None
+        elif precision == 'float32':
+            self.matrix = features.astype(np.float32, copy=False)
+            self.scale = None
+            self.sq_norms = np.einsum('ij,ij->i', self.matrix, self.matrix)
+        else:
+            self.scale = _quantization_scale(features)
+            self.matrix = np.clip(np.rint(features / self.scale), -127, 127).astype(np.int8)
+            dequantized = self.matrix * self.scale
+            self.sq_norms = np.einsum('ij,ij->i', dequantized, dequantized)
+
+    @property
+    def nbytes(self):
+        """
+        Memory held by the stored feature matrix, row norms and quantization scales
+        """
+        extra = [getattr(self, name, None) for name in ('scale', 'sq_norms')]
+        return self.matrix.nbytes + sum(array.nbytes for array in extra if array is not None)
+
+    def _ranking_keys(self, query):
+        """
+        Squared euclidean distances minus the query's own squared norm, in float32.
+
+        Expanding |x - q|^2 as |x|^2 - 2 q.x keeps the precision float32 needs when
+        a query lies far outside the catalogue (e.g. raw salary expectations), and
+        lets int8 rows be compared against an unquantized query.
+        """
+        if self.precision == 'float32':
+            return self.sq_norms - 2 * (self.matrix @ query.astype(np.float32))
+
+        # matrix @ query would first copy the whole int8 matrix to float32;
+        # widen one block at a time into a reused buffer instead
+        weighted_query = (query * self.scale).astype(np.float32)
+        dots = np.empty(self.n_samples, dtype=np.float32)
+        block = np.empty((min(INT8_BLOCK_ROWS, self.n_samples), self.matrix.shape[1]), dtype=np.float32)
+
+        for start in range(0, self.n_samples, INT8_BLOCK_ROWS):
+            rows = self.matrix[start:start + INT8_BLOCK_ROWS]
+            np.copyto(block[:len(rows)], rows, casting='unsafe')
+            np.matmul(block[:len(rows)], weighted_query, out=dots[start:start + len(rows)])
+
+        return self.sq_norms - 2 * dots
+
+    def kneighbors(self, queries, n_neighbors):
+        """
+        Find the nearest jobs for each query vector
+
+        Args:
+            queries (array-like): (M, D) normalized query vectors
+            n_neighbors (int): Number of neighbours to return
+
+        Returns:
+            tuple: (distances, indices), each of shape (M, n_neighbors), nearest first
+        """
+        if n_neighbors > self.n_samples:
+            raise ValueError(
+                f"Expected n_neighbors <= n_samples, but n_samples = {self.n_samples}, "
+                f"n_neighbors = {n_neighbors}"
+            )
+
+        if self.precision == 'float64':
+            return self._knn.kneighbors(queries, n_neighbors=n_neighbors)
+
+        queries = np.asarray(queries, dtype=np.float64)
+        distances = np.empty((len(queries), n_neighbors))
+        indices = np.empty((len(queries), n_neighbors), dtype=np.intp)
+
+        for row, query in enumerate(queries):
+            keys = self._ranking_keys(query)
+            nearest = np.argpartition(keys, n_neighbors - 1)[:n_neighbors]
+            nearest = nearest[np.argsort(keys[nearest], kind='stable')]
+            indices[row] = nearest
+            distances[row] = np.sqrt(np.maximum(keys[nearest] + query @ query, 0))
+
+        return distances, indices
+
+def precision_report(features, queries, k=10, precisions=PRECISIONS):
+    """
+    Compare reduced-precision indexes against float64
+
+    Args:
+        features (array-like): (N, D) normalized job features
+        queries (array-like): (M, D) normalized query vectors
+        k (int): Neighbours per query
+        precisions (tuple): Precisions to report on
+
+    Returns:
+        dict: Per precision, matrix bytes, index build time and mean query time
+              in milliseconds, and mean top-k overlap with the float64 neighbours (0-1)
+    """
+    k = min(k, len(features))
+    _, reference = JobIndex(features, 'float64').kneighbors(queries, k)
+
+    report = {}
+    for precision in precisions:
+        start = time.perf_counter()
+        index = JobIndex(features, precision)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        _, indices = index.kneighbors(queries, k)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        overlap = np.mean([
+            len(set(expected) & set(found)) / k
+            for expected, found in zip(reference, indices)
+        ]) if k else 1.0
+
+        report[precision] = {
+            'bytes': index.nbytes,
+            'buildMs': round(build_ms, 4),
+            'queryMs': round(elapsed_ms / max(len(queries), 1), 4),
+            'topKOverlap': round(float(overlap), 4)
+        }
+
+    return report
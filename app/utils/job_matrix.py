@@ -0,0 +1,275 @@
+import numpy as np
+from scipy import sparse
+
+# Features that depend only on the job; salary and skill columns are employee-relative
+STATIC_FEATURES = [
+    'job_type_id',
+    'position_id',
+    'year_experience',
+    'industry_id',
+    'contract_type_id',
+    'district_id',
+    'city_id'
+]
+
+# Upper bound on the cells of each (employees x jobs) array built at once.
+# score() keeps several of them alive, so this caps a batch at roughly
+# ten 8 MB float64 arrays however large the catalogue is.
+MAX_BLOCK_CELLS = 1_000_000
+
+def safe_scale(std):
+    """
+    Replace (near) zero standard deviations with 1, as StandardScaler does
+    """
+    return np.where(std < 10 * np.finfo(np.float64).eps, 1.0, std)
+
+def salary_compatibility_matrix(employee_min, employee_max, job_min, job_max):
+    """
+    Vectorized JobRecommender.calculate_salary_compatibility
+
+    Args:
+        employee_min (ndarray): (E,) employee minimum salaries, 0 when unknown
+        employee_max (ndarray): (E,) employee maximum salaries, inf when unknown
+        job_min (ndarray): (J,) job minimum salaries, 0 when unknown
+        job_max (ndarray): (J,) job maximum salaries, inf when unknown
+
+    Returns:
+        ndarray: (E, J) salary compatibility scores (0-1)
+    """
+    employee_min = employee_min[:, None]
+    employee_max = employee_max[:, None]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        overlapping = (job_min <= employee_max) & (job_max >= employee_min)
+
+        # Scenario 1: share of the employee range covered by the job range
+        overlap_range = np.maximum(0, np.minimum(employee_max, job_max) - np.maximum(employee_min, job_min))
+        overlap_score = overlap_range / (employee_max - employee_min)
+
+        # Scenario 2: halved proximity penalty
+        proximity_penalty = np.where(
+            job_max < employee_min,
+            1 - (employee_min - job_max) / employee_min,
+            1 - (job_min - employee_max) / job_min
+        ) * 0.5
+
+        scores = np.where(overlapping, overlap_score, proximity_penalty)
+
+    # inf/inf (both ranges open-ended) and zero-width ranges count as a full match
+    scores = np.where(np.isnan(scores), 1.0, scores)
+
+    return np.clip(scores, 0, 1)
+
+def skill_match_matrix(employee_skills, employee_set_sizes, employee_list_sizes, job_skills, job_set_sizes):
+    """
+    Vectorized JobRecommender.calculate_skill_match
+
+    Args:
+        employee_skills (csr_matrix): (E, S) binary employee skill matrix
+        employee_set_sizes (ndarray): (E,) number of distinct employee skills
+        employee_list_sizes (ndarray): (E,) length of the employee skill list
+        job_skills (csr_matrix): (J, S) binary job skill matrix
+        job_set_sizes (ndarray): (J,) number of distinct job skills
+
+    Returns:
+        ndarray: (E, J) skill match scores (0-1)
+    """
+    exact_match = np.asarray((employee_skills @ job_skills.T).todense(), dtype=np.float64)
+    total_skills = employee_set_sizes[:, None] + job_set_sizes[None, :] - exact_match
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scores = (
+            0.7 * (exact_match / np.maximum(employee_list_sizes, 1)[:, None]) +
+            0.3 * (exact_match / total_skills)
+        )
+
+    has_skills = (employee_list_sizes[:, None] > 0) & (job_set_sizes[None, :] > 0)
+
+    return np.minimum(1.0, np.where(has_skills, scores, 0.0))
+
+class JobMatrix:
+    def __init__(self, job_features):
+        """
+        Columnar job catalogue for scoring many employees in one pass.
+        Reproduces JobRecommender.recommend_jobs without a per-employee KNN fit.
+
+        Args:
+            job_features (list): List of flattened job dictionaries
+        """
+        self.job_features = job_features
+
+        static = np.array(
+            [[job.get(feature, 0.0) for feature in STATIC_FEATURES] for job in job_features],
+            dtype=np.float64
+        ).reshape(len(job_features), len(STATIC_FEATURES))
+
+        # Job-only columns are standardized the same way for every employee
+        self.static_mean = static.mean(axis=0) if len(job_features) else np.zeros(len(STATIC_FEATURES))
+        self.static_scale = safe_scale(static.std(axis=0)) if len(job_features) else np.ones(len(STATIC_FEATURES))
+        self.static_scaled = (static - self.static_mean) / self.static_scale
+        self.static_sq_norms = (self.static_scaled ** 2).sum(axis=1)
+
+        self.min_salary = np.array([job.get('min_salary', 0) or 0.0 for job in job_features], dtype=np.float64)
+        self.max_salary = np.array([job.get('max_salary', 0) or np.inf for job in job_features], dtype=np.float64)
+
+        # Sparse job x skill matrix over the catalogue's skill vocabulary
+        self.skill_index = {}
+        rows, cols = [], []
+        for row, job in enumerate(job_features):
+            for skill_id in set(job.get('skill_ids', [])):
+                rows.append(row)
+                cols.append(self.skill_index.setdefault(skill_id, len(self.skill_index)))
+
+        self.skill_matrix = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, cols)),
+            shape=(len(job_features), len(self.skill_index))
+        )
+        self.skill_set_sizes = np.asarray(self.skill_matrix.sum(axis=1), dtype=np.float64).ravel()
+
+    def __len__(self):
+        return len(self.job_features)
+
+    def _employee_skill_matrix(self, employees):
+        """
+        Build the sparse employee x skill matrix against the job skill vocabulary
+
+        Returns:
+            tuple: (skill matrix, distinct skill counts, skill list lengths)
+        """
+        rows, cols = [], []
+        set_sizes = np.zeros(len(employees))
+        list_sizes = np.zeros(len(employees))
+
+        for row, employee in enumerate(employees):
+            skills = employee.get('skill_ids', [])
+            set_sizes[row] = len(set(skills))
+            list_sizes[row] = len(skills)
+
+            # Skills no job asks for only widen the union, so they need no column
+            for skill_id in set(skills):
+                col = self.skill_index.get(skill_id)
+                if col is not None:
+                    rows.append(row)
+                    cols.append(col)
+
+        matrix = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, cols)),
+            shape=(len(employees), len(self.skill_index))
+        )
+
+        return matrix, set_sizes, list_sizes
+
+    def score(self, employees):
+        """
+        Score a batch of employees against every job. Each returned array holds
+        len(employees) x len(jobs) float64 cells; recommend_batch keeps that bounded.
+
+        Args:
+            employees (list): List of flattened employee dictionaries
+
+        Returns:
+            tuple: (E, J) arrays of distances, skill matches and salary compatibilities
+        """
+        static = np.array(
+            [[employee.get(feature, 0.0) for feature in STATIC_FEATURES] for employee in employees],
+            dtype=np.float64
+        ).reshape(len(employees), len(STATIC_FEATURES))
+        static_scaled = (static - self.static_mean) / self.static_scale
+
+        # Squared euclidean distance over job-only columns, ||a||^2 + ||b||^2 - 2ab
+        sq_distances = (
+            (static_scaled ** 2).sum(axis=1)[:, None] +
+            self.static_sq_norms[None, :] -
+            2 * static_scaled @ self.static_scaled.T
+        )
+        np.maximum(sq_distances, 0, out=sq_distances)
+
+        # Salary compatibility fills both salary columns of the job vector,
+        # while the employee vector carries its raw salary expectations
+        salary_compatibility = salary_compatibility_matrix(
+            np.array([employee.get('min_salary') or 0.0 for employee in employees], dtype=np.float64),
+            np.array([employee.get('max_salary') or np.inf for employee in employees], dtype=np.float64),
+            self.min_salary,
+            self.max_salary
+        )
+        salary_scale = safe_scale(salary_compatibility.std(axis=1, keepdims=True))
+        for feature in ('max_salary', 'min_salary'):
+            employee_salary = np.array([employee.get(feature, 0.0) for employee in employees], dtype=np.float64)
+            sq_distances += ((salary_compatibility - employee_salary[:, None]) / salary_scale) ** 2
+
+        employee_skills, set_sizes, list_sizes = self._employee_skill_matrix(employees)
+        skill_match = skill_match_matrix(
+            employee_skills, set_sizes, list_sizes,
+            self.skill_matrix, self.skill_set_sizes
+        )
+
+        # An employee's own skill feature is its match against itself
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self_skill_match = np.where(
+                list_sizes > 0,
+                np.minimum(1.0, 0.7 * set_sizes / np.maximum(list_sizes, 1) + 0.3),
+                0.0
+            )
+        skill_scale = safe_scale(skill_match.std(axis=1, keepdims=True))
+        sq_distances += ((skill_match - self_skill_match[:, None]) / skill_scale) ** 2
+
+        return np.sqrt(sq_distances), skill_match, salary_compatibility
+
+    def recommend_batch(self, employees, k=5):
+        """
+        Recommend top K jobs for each employee in a batch
+
+        Employees are scored in blocks of at most MAX_BLOCK_CELLS employee-job
+        pairs, so memory stays bounded for large catalogues.
+
+        Args:
+            employees (list): List of flattened employee dictionaries
+            k (int): Number of job recommendations per employee
+
+        Returns:
+            list: One list of recommendations per employee, in the same shape
+                  as JobRecommender.recommend_jobs
+        """
+        if not employees:
+            return []
+
+        k = min(k, len(self.job_features))
+        if k <= 0:
+            return [[] for _ in employees]
+
+        block_size = max(1, MAX_BLOCK_CELLS // len(self.job_features))
+
+        batch_recommendations = []
+        for start in range(0, len(employees), block_size):
+            batch_recommendations.extend(self._recommend_block(employees[start:start + block_size], k))
+
+        return batch_recommendations
+
+    def _recommend_block(self, employees, k):
+        distances, skill_match, salary_compatibility = self.score(employees)
+
+        # Nearest K jobs per employee, then re-rank by weighted similarity
+        nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+        rows = np.arange(len(employees))[:, None]
+        weighted_similarity = (
+            0.5 * (1 / (1 + distances[rows, nearest])) +
+            0.3 * skill_match[rows, nearest] +
+            0.2 * salary_compatibility[rows, nearest]
+        )
+        order = np.argsort(-weighted_similarity, axis=1, kind='stable')
+
+        block_recommendations = []
+        for row in range(len(employees)):
+            recommendations = []
+            for position in order[row]:
+                idx = nearest[row, position]
+                recommendations.append({
+                    'job': self.job_features[idx],
+                    'similarity_score': float(weighted_similarity[row, position]),
+                    'skill_match': float(skill_match[row, idx]),
+                    'salary_compatibility': float(salary_compatibility[row, idx]),
+                    'distance': float(distances[row, idx])
+                })
+            block_recommendations.append(recommendations)
+
+        return block_recommendations
@@ -1,18 +1,21 @@
 import numpy as np
 from sklearn.preprocessing import StandardScaler
-from sklearn.neighbors import NearestNeighbors
+
+from app.utils.job_index import JobIndex
 
 class JobRecommender:
-    def __init__(self, employee_features, job_features):
+    def __init__(self, employee_features, job_features, precision='float64'):
         """
         Initialize KNN Job Recommender
         
         Args:
             employee_features (dict): Employee characteristics
             job_features (list): List of job dictionaries
+            precision (str): Job index precision: 'float64', 'float32' or 'int8'
         """
         self.employee_features = employee_features
         self.job_features = job_features
+        self.precision = precision
         
         # Predefined feature order for consistency
         self.feature_order = [
@@ -151,8 +154,9 @@ class JobRecommender:
         Returns:
             tuple: (feature matrix, scaler)
         """
-        # Extract features for all jobs
-        job_features = [self.extract_features(job) for job in self.job_features]
+        # Extract features for all jobs; reduced precisions are standardized in float32
+        dtype = np.float64 if self.precision == 'float64' else np.float32
+        job_features = np.array([self.extract_features(job) for job in self.job_features], dtype=dtype)
         
         # Standardize features
         scaler = StandardScaler()
@@ -179,12 +183,11 @@ class JobRecommender:
         # Normalize employee vector
         normalized_employee = scaler.transform([employee_vector])
 
-        # Create KNN model
-        knn = NearestNeighbors(n_neighbors=k, metric='euclidean')
-        knn.fit(job_features_matrix)
+        # Create KNN index
+        job_index = JobIndex(job_features_matrix, self.precision)
         
         # Find nearest neighbors
-        distances, indices = knn.kneighbors(normalized_employee)
+        distances, indices = job_index.kneighbors(normalized_employee, k)
         
         # Prepare recommendations
         recommendations = []
@@ -247,12 +250,11 @@ class JobRecommender:
         # Normalize target job vector
         normalized_target_job = scaler.transform([target_job_vector])
         
-        # Create KNN model
-        knn = NearestNeighbors(n_neighbors=k+1, metric='euclidean')  # k+1 to exclude the job itself
-        knn.fit(job_features_matrix)
+        # Create KNN index
+        job_index = JobIndex(job_features_matrix, self.precision)
         
         # Find nearest neighbors
-        distances, indices = knn.kneighbors(normalized_target_job)
+        distances, indices = job_index.kneighbors(normalized_target_job, k+1)  # k+1 to exclude the job itself
         
         # Prepare recommendations
         recommendations = []
@@ -0,0 +1,113 @@
+import atexit
+import json
+import logging
+import queue
+import random
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+# Package logger; Flask's app.logger and every module logger under app.* propagate here
+LOGGER_NAME = 'app'
+
+# Attributes present on every LogRecord, anything else was passed through `extra`
+_RESERVED_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+_listener = None
+
+class JsonFormatter(logging.Formatter):
+    """
+    Render a log record as a single JSON line, including `extra` fields
+    """
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record, '%Y-%m-%dT%H:%M:%S'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS:
+                entry[key] = value
+
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exc_info'] = record.exc_text
+
+        return json.dumps(entry, default=str)
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep only a fraction of records below WARNING; warnings and errors always pass
+    """
+    def __init__(self, sample_rate):
+        super().__init__()
+        self.sample_rate = sample_rate
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING or self.sample_rate >= 1.0:
+            return True
+        return random.random() < self.sample_rate
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    QueueHandler that drops records instead of blocking when the queue is full
+    """
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        # Formatting happens on the listener thread; only resolve the message here
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+def configure_logging(level='INFO', sample_rate=1.0, queue_size=10000):
+    """
+    Route the app's logs through a bounded queue to a background writer thread,
+    so request threads never block on stdout
+
+    Args:
+        level (str): Minimum log level
+        sample_rate (float): Fraction of DEBUG/INFO records to keep (0-1)
+        queue_size (int): Maximum number of records waiting to be written
+
+    Returns:
+        logging.Logger: The configured package logger
+    """
+    global _listener
+
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(level)
+
+    # create_app may run more than once per process; only start one listener
+    if _listener is not None:
+        return logger
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JsonFormatter())
+
+    log_queue = queue.Queue(maxsize=queue_size)
+    queue_handler = DroppingQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter(sample_rate))
+
+    logger.handlers = [queue_handler]
+    logger.propagate = False
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    return logger
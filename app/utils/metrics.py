@@ -0,0 +1,42 @@
+import threading
+from collections import defaultdict
+
+def _key(name, labels):
+    if not labels:
+        return name
+    label_str = ','.join(f"{k}={v}" for k, v in sorted(labels.items()))
+    return f"{name}{{{label_str}}}"
+
+class Metrics:
+    """
+    Minimal thread-safe in-process counters and timings
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = defaultdict(int)
+        self._timings = {}
+
+    def increment(self, name, value=1, **labels):
+        with self._lock:
+            self._counters[_key(name, labels)] += value
+
+    def observe(self, name, value_ms, **labels):
+        """
+        Record a duration in milliseconds (count, sum and max are kept)
+        """
+        key = _key(name, labels)
+        with self._lock:
+            timing = self._timings.setdefault(key, {'count': 0, 'sumMs': 0.0, 'maxMs': 0.0})
+            timing['count'] += 1
+            timing['sumMs'] += value_ms
+            timing['maxMs'] = max(timing['maxMs'], value_ms)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'counters': dict(self._counters),
+                'timings': {key: dict(timing) for key, timing in self._timings.items()}
+            }
+
+# Process-wide registry
+metrics = Metrics()
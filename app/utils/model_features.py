@@ -0,0 +1,97 @@
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from app.models import Employee
+
+def _without_empty(d):
+    """
+    Drop None values and empty lists, like remove_none_values does for request payloads
+    """
+    return {
+        k: v
+        for k, v in d.items()
+        if v is not None and (not isinstance(v, list) or len(v) > 0)
+    }
+
+def flatten_employee_model(employee):
+    """
+    Flatten an Employee model (with career goal, skills and educations loaded)
+    into the same shape as flatten_employee_data
+
+    Args:
+        employee (Employee): Employee model instance
+
+    Returns:
+        dict: Flattened employee dictionary
+    """
+    career_goal = employee.career_goal
+
+    return _without_empty({
+        'id': employee.id,
+        'education_level_ids': [education.education_level_id for education in employee.educations],
+        'industry_id': career_goal.industry_id if career_goal else None,
+        'job_type_id': career_goal.job_type_id if career_goal else None,
+        'min_salary': career_goal.min_salary if career_goal else None,
+        'max_salary': career_goal.max_salary if career_goal else None,
+        'position_id': career_goal.position_id if career_goal else None,
+        'skill_ids': [skill.skill_id for skill in employee.employee_skills]
+    })
+
+def flatten_job_model(job):
+    """
+    Flatten a Job model (with job skills loaded) into the same shape as flatten_job_data
+
+    Args:
+        job (Job): Job model instance
+
+    Returns:
+        dict: Flattened job dictionary
+    """
+    return _without_empty({
+        'id': job.id,
+        'job_type_id': job.job_type_id,
+        'position_id': job.position_id,
+        'year_experience': job.year_experience,
+        'max_salary': job.max_salary,
+        'min_salary': job.min_salary,
+        'contract_type_id': job.contract_type_id,
+        'district_id': job.district_id,
+        'city_id': job.city_id,
+        'skill_ids': [skill.skill_id for skill in job.job_skills]
+    })
+
+def stream_employee_chunks(db, after_id, chunk_size):
+    """
+    Yield flattened employees in id order using keyset pagination
+
+    Args:
+        db (Session): Database session
+        after_id (int): Only employees with a greater id are returned
+        chunk_size (int): Employees per chunk
+
+    Yields:
+        list: Flattened employee dictionaries
+    """
+    while True:
+        employees = db.scalars(
+            select(Employee)
+            .where(Employee.id > after_id)
+            .order_by(Employee.id)
+            .limit(chunk_size)
+            .options(
+                selectinload(Employee.career_goal),
+                selectinload(Employee.employee_skills),
+                selectinload(Employee.educations)
+            )
+        ).all()
+
+        if not employees:
+            return
+
+        after_id = employees[-1].id
+        chunk = [flatten_employee_model(employee) for employee in employees]
+
+        # Keep the identity map from growing across the whole table
+        db.expunge_all()
+
+        yield chunk
@@ -0,0 +1,83 @@
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+class PeriodicRefresh:
+    def __init__(self, name, load, interval_seconds):
+        """
+        Reload a value from a daemon thread so readers never wait on the load.
+        Readers see the previous value until the new one is swapped in.
+
+        Args:
+            name (str): Thread name, also used in log records
+            load (callable): Builds and returns the new value
+            interval_seconds (float): Seconds between the end of one load and the next
+        """
+        self.name = name
+        self.load = load
+        self.interval_seconds = interval_seconds
+
+        self.value = None
+        self.loaded_at = None
+        self.error = None
+
+        self._loaded = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self):
+        return self._loaded.is_set()
+
+    def start(self):
+        """
+        Start the refresh thread; later calls do nothing
+
+        Returns:
+            PeriodicRefresh: self
+        """
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+
+        return self
+
+    def wait(self, timeout=None):
+        """
+        Block until the first load has completed
+
+        Returns:
+            bool: True if a value is loaded
+        """
+        return self._loaded.wait(timeout)
+
+    def refresh(self):
+        """
+        Load once in the calling thread and swap the new value in
+        """
+        started_at = time.perf_counter()
+
+        # A single reference assignment, readers see either the old or the new value
+        self.value = self.load()
+        self.loaded_at = time.time()
+        self.error = None
+        self._loaded.set()
+
+        logger.info('refresh completed', extra={
+            'refresh': self.name,
+            'elapsed_ms': round((time.perf_counter() - started_at) * 1000, 2)
+        })
+
+    def _run(self):
+        while True:
+            try:
+                self.refresh()
+            except Exception as e:
+                # Keep serving the last good value and retry on the next interval
+                self.error = str(e)
+                logger.exception('refresh failed', extra={'refresh': self.name})
+
+            time.sleep(self.interval_seconds)
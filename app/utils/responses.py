@@ -0,0 +1,27 @@
+import orjson
+from flask import Response
+
+def dumps(payload):
+    """
+    Serialize a payload to compact JSON bytes with orjson
+
+    Args:
+        payload: JSON-serializable object, NumPy scalars and arrays included
+
+    Returns:
+        bytes: Compact JSON document
+    """
+    return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+
+def json_response(payload, status=200):
+    """
+    Build a JSON response without jsonify's pretty-printing and key sorting
+
+    Args:
+        payload: JSON-serializable object
+        status (int): HTTP status code
+
+    Returns:
+        Response: Flask response with an application/json body
+    """
+    return Response(dumps(payload), status=status, mimetype='application/json')
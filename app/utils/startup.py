@@ -0,0 +1,166 @@
+import threading
+import time
+from contextlib import contextmanager
+
+from app.config import Config
+
+# Reference point for the whole process; this module is imported first by the app package
+_process_started_at = time.perf_counter()
+
+_phases = {}
+_phases_lock = threading.Lock()
+
+_ready = threading.Event()
+_state = {
+    'mode': None,
+    'error': None
+}
+
+_recommender_cls = None
+_recommender_lock = threading.Lock()
+
+# Small synthetic catalogue used to exercise the full scoring path during warm-up
+_WARMUP_EMPLOYEE = {
+    'industry_id': 1,
+    'job_type_id': 1,
+    'position_id': 1,
+    'min_salary': 1000,
+    'max_salary': 2000,
+    'skill_ids': [1, 2, 3]
+}
+
+_WARMUP_JOBS = [
+    {
+        'id': job_id,
+        'job_type_id': job_id % 3 + 1,
+        'position_id': job_id % 4 + 1,
+        'year_experience': job_id % 5,
+        'min_salary': 800 + job_id * 100,
+        'max_salary': 1500 + job_id * 150,
+        'industry_id': job_id % 2 + 1,
+        'contract_type_id': 1,
+        'district_id': job_id,
+        'city_id': 1,
+        'skill_ids': [job_id, job_id + 1]
+    }
+    for job_id in range(1, 9)
+]
+
+STARTUP_MODES = ('eager', 'background', 'lazy')
+
+
+@contextmanager
+def timed_phase(name):
+    """
+    Measure the wall-clock duration of a startup phase
+
+    Args:
+        name (str): Phase name as reported by the readiness endpoint
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with _phases_lock:
+            _phases[name] = round(elapsed_ms, 2)
+
+
+def get_job_recommender_class():
+    """
+    Import JobRecommender (and with it numpy/scikit-learn) on first use
+
+    Returns:
+        type: The JobRecommender class
+    """
+    global _recommender_cls
+
+    if _recommender_cls is None:
+        with _recommender_lock:
+            if _recommender_cls is None:
+                with timed_phase('import_job_recommender'):
+                    from app.utils.job_recommender import JobRecommender
+                _recommender_cls = JobRecommender
+
+    return _recommender_cls
+
+
+def warm_up():
+    """
+    Import the recommender and build a job index on a synthetic catalogue,
+    so the first real request does not pay for library initialisation, and
+    start the background loads of the database-backed lookups that are
+    configured to preload.
+    Marks the service ready on success.
+    """
+    try:
+        with timed_phase('warm_up'):
+            recommender_cls = get_job_recommender_class()
+            recommender = recommender_cls(
+                _WARMUP_EMPLOYEE,
+                _WARMUP_JOBS,
+                precision=Config.RECOMMENDER_PRECISION
+            )
+            with timed_phase('build_job_index'):
+                recommender.recommend_jobs(k=4)
+                recommender.recommend_similar_jobs(job_id=_WARMUP_JOBS[0]['id'], k=3)
+
+            # Database-backed lookups are opt-in; each loads in its own background thread
+            if Config.DATABASE_URL and Config.PRELOAD_EMPLOYEE_INDEX:
+                with timed_phase('start_employee_index'):
+                    from app.utils.employee_index import get_database_employee_index
+                    get_database_employee_index(Config.EMPLOYEE_INDEX_TTL_SECONDS)
+
+            if Config.DATABASE_URL and Config.PRELOAD_EMPLOYEE_FEATURES:
+                with timed_phase('start_employee_features'):
+                    from app.utils.employee_feature_store import get_employee_feature_store
+                    get_employee_feature_store()
+        _ready.set()
+    except Exception as e:
+        # Leave the service unready so the readiness probe keeps failing
+        _state['error'] = str(e)
+
+
+def start(mode):
+    """
+    Run the startup sequence for the given mode
+
+    Args:
+        mode (str): 'eager' warms up before returning,
+                    'background' warms up in a daemon thread,
+                    'lazy' defers all heavy imports to the first request
+    """
+    if mode not in STARTUP_MODES:
+        raise ValueError(f"Unknown startup mode '{mode}', expected one of {STARTUP_MODES}")
+
+    _state['mode'] = mode
+
+    if mode == 'eager':
+        warm_up()
+    elif mode == 'background':
+        threading.Thread(target=warm_up, name='recommender-warm-up', daemon=True).start()
+    else:
+        _ready.set()
+
+
+def is_ready():
+    return _ready.is_set()
+
+
+def startup_report():
+    """
+    Summarise startup progress and per-phase timings
+
+    Returns:
+        dict: Mode, readiness, warm-up error and phase durations in milliseconds
+    """
+    with _phases_lock:
+        phases = dict(_phases)
+
+    return {
+        'mode': _state['mode'],
+        'ready': is_ready(),
+        'error': _state['error'],
+        'phasesMs': phases,
+        'uptimeMs': round((time.perf_counter() - _process_started_at) * 1000, 2)
+    }
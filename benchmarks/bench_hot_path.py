@@ -0,0 +1,85 @@
+"""
+Micro-benchmark for the response hot path: logging and JSON encoding
+
+Compares the previous behaviour (print per recommendation plus the flattened
+job list, jsonify) with queue-based logging and json_response.
+
+Usage:
+    python -m benchmarks.bench_hot_path --jobs 5000 --repeat 50
+"""
+import argparse
+import io
+import logging
+import random
+import time
+from contextlib import redirect_stdout
+
+from flask import Flask, jsonify
+
+from app.utils.logging_setup import configure_logging
+from app.utils.responses import json_response
+
+def _jobs(count):
+    return [
+        {
+            'id': job_id,
+            'job_type_id': random.randint(1, 5),
+            'position_id': random.randint(1, 10),
+            'min_salary': random.randint(5, 20) * 100,
+            'max_salary': random.randint(21, 40) * 100,
+            'skill_ids': random.sample(range(200), 5)
+        }
+        for job_id in range(count)
+    ]
+
+def _results(count):
+    return [{'jobId': job_id, 'similarityScore': random.random()} for job_id in range(count)]
+
+def _time(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark logging and JSON encoding on the request path')
+    parser.add_argument('--jobs', type=int, default=5000, help='Jobs in the flattened catalogue')
+    parser.add_argument('--results', type=int, default=5000, help='Entries in the encoded result list')
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    random.seed(0)
+    jobs = _jobs(args.jobs)
+    results = _results(args.results)
+    app = Flask(__name__)
+
+    # stdout is a pipe or terminal in production; write into a buffer to keep the console readable
+    sink = io.StringIO()
+
+    def print_logging():
+        with redirect_stdout(sink):
+            print('/similar')
+            print(jobs)
+            for rec in results[:5]:
+                print(f"Similarity Score: {rec['similarityScore']:.2f}\n")
+
+    configure_logging('INFO')
+    logger = logging.getLogger('app.benchmarks')
+
+    def queue_logging():
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('similar jobs computed', extra={'job_count': len(jobs)})
+        logger.info('similar jobs computed', extra={'job_count': len(jobs)})
+
+    with app.app_context():
+        encode_jsonify = _time(lambda: jsonify(results).get_data(), args.repeat)
+        encode_fast = _time(lambda: json_response(results).get_data(), args.repeat)
+
+    print_ms = _time(print_logging, args.repeat)
+    queue_ms = _time(queue_logging, args.repeat)
+
+    print(f"logging   print: {print_ms:8.3f} ms/request   queue: {queue_ms:8.3f} ms/request")
+    print(f"encoding  jsonify: {encode_jsonify:8.3f} ms/request   json_response: {encode_fast:8.3f} ms/request")
+
+if __name__ == '__main__':
+    main()
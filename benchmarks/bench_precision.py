@@ -0,0 +1,76 @@
+"""
+Compare float64, float32 and int8 job indexes on a synthetic catalogue
+
+Reports feature matrix memory, index build time, neighbour search time and
+top-k overlap with the float64 neighbours, averaged over a set of random
+employees.
+
+Usage:
+    python -m benchmarks.bench_precision --jobs 20000 --employees 50 --k 10
+"""
+import argparse
+import random
+
+import numpy as np
+
+from app.utils.job_index import PRECISIONS, precision_report
+from app.utils.job_recommender import JobRecommender
+
+def _job(job_id):
+    min_salary = random.randint(5, 30) * 100
+    return {
+        'id': job_id,
+        'job_type_id': random.randint(1, 4),
+        'position_id': random.randint(1, 12),
+        'year_experience': random.randint(0, 10),
+        'min_salary': min_salary,
+        'max_salary': min_salary + random.randint(0, 20) * 100,
+        'industry_id': random.randint(1, 20),
+        'contract_type_id': random.randint(1, 3),
+        'district_id': random.randint(1, 700),
+        'city_id': random.randint(1, 63),
+        'skill_ids': random.sample(range(500), random.randint(1, 8))
+    }
+
+def _employee():
+    min_salary = random.randint(5, 30) * 100
+    return {
+        'industry_id': random.randint(1, 20),
+        'job_type_id': random.randint(1, 4),
+        'position_id': random.randint(1, 12),
+        'min_salary': min_salary,
+        'max_salary': min_salary + random.randint(1, 20) * 100,
+        'skill_ids': random.sample(range(500), random.randint(1, 8))
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare job index precisions')
+    parser.add_argument('--jobs', type=int, default=20000)
+    parser.add_argument('--employees', type=int, default=50)
+    parser.add_argument('--k', type=int, default=10)
+    args = parser.parse_args()
+
+    random.seed(0)
+    jobs = [_job(job_id) for job_id in range(args.jobs)]
+
+    totals = {precision: {'bytes': 0, 'buildMs': 0.0, 'queryMs': 0.0, 'topKOverlap': 0.0} for precision in PRECISIONS}
+    for _ in range(args.employees):
+        recommender = JobRecommender(_employee(), jobs)
+        features, scaler = recommender.prepare_feature_matrix()
+        query = scaler.transform([recommender.extract_features(recommender.employee_features, is_employee=True)])
+
+        for precision, result in precision_report(features, query, k=args.k).items():
+            totals[precision]['bytes'] = result['bytes']
+            totals[precision]['buildMs'] += result['buildMs'] / args.employees
+            totals[precision]['queryMs'] += result['queryMs'] / args.employees
+            totals[precision]['topKOverlap'] += result['topKOverlap'] / args.employees
+
+    print(f"{args.jobs} jobs, {args.employees} employees, top-{args.k}")
+    for precision, result in totals.items():
+        print(f"{precision:>8}: {result['bytes'] / 1024:9.1f} KiB  "
+              f"{result['buildMs']:8.3f} ms build  "
+              f"{result['queryMs']:8.3f} ms/query  "
+              f"top-{args.k} overlap {np.round(result['topKOverlap'], 4)}")
+
+if __name__ == '__main__':
+    main()
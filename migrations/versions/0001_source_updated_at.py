@@ -0,0 +1,52 @@
+"""Maintain updated_at on career_goal and employee_skill
+
+The employee feature refresh finds changed employees by these timestamps.
+Rows are written by other services too, so on PostgreSQL a trigger keeps
+updated_at current for every UPDATE, not only for writes through this
+service's models.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+TABLES = ('career_goal', 'employee_skill')
+
+def upgrade():
+    for table in TABLES:
+        # Existing rows take the default, so the first refresh sees a watermark
+        op.add_column(table, sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now(), nullable=True))
+        op.create_index(f'ix_{table}_updated_at', table, ['updated_at'])
+
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("""
+            CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+            BEGIN
+                NEW.updated_at = now();
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql
+        """)
+        for table in TABLES:
+            op.execute(f"""
+                CREATE TRIGGER {table}_set_updated_at
+                BEFORE UPDATE ON {table}
+                FOR EACH ROW EXECUTE PROCEDURE set_updated_at()
+            """)
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        for table in TABLES:
+            op.execute(f'DROP TRIGGER IF EXISTS {table}_set_updated_at ON {table}')
+        op.execute('DROP FUNCTION IF EXISTS set_updated_at()')
+
+    for table in TABLES:
+        op.drop_index(f'ix_{table}_updated_at', table_name=table)
+        op.drop_column(table, 'updated_at')
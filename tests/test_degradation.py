@@ -0,0 +1,114 @@
+import heapq
+import random
+
+import pytest
+
+from app.utils.degradation import DegradationLadder
+from app.utils.job_recommender import JobRecommender
+
+def random_job(rng, job_id):
+    return {
+        'id': job_id,
+        'job_type_id': rng.randint(1, 3),
+        'position_id': rng.randint(1, 5),
+        'industry_id': rng.randint(1, 4),
+        'min_salary': rng.randint(5, 20) * 100,
+        'max_salary': rng.randint(21, 40) * 100,
+        'skill_ids': [rng.randint(0, 20) for _ in range(rng.randint(0, 5))]
+    }
+
+def random_employee(rng):
+    return {
+        'job_type_id': rng.randint(1, 3),
+        'industry_id': rng.randint(1, 4),
+        'min_salary': 1000,
+        'max_salary': 3000,
+        'skill_ids': rng.sample(range(20), rng.randint(0, 5))
+    }
+
+def make_ladder(**kwargs):
+    ladder = DegradationLadder(JobRecommender, candidate_pool_size=50, approximate_pool_size=10, **kwargs)
+    ladder._ms_per_job = {'exact': 0.1, 'candidate_pool': 0.1, 'approximate': 0.1, 'prefilter': 0.001}
+    return ladder
+
+def test_choose_path():
+    ladder = make_ladder(safety_factor=1.0)
+
+    # exact 100 ms, candidate_pool 1 + 5 ms, approximate 1 + 1 ms for 1000 jobs
+    assert ladder.choose_path(1000, None) == 'exact'
+    assert ladder.choose_path(1000, 100) == 'exact'
+    assert ladder.choose_path(1000, 50) == 'candidate_pool'
+    assert ladder.choose_path(1000, 3) == 'approximate'
+    assert ladder.choose_path(1000, 1) == 'fallback'
+
+def test_choose_path_applies_safety_factor():
+    ladder = make_ladder(safety_factor=0.5)
+
+    assert ladder.choose_path(1000, 100) == 'candidate_pool'
+
+def test_fallback_pads_with_catalogue_order():
+    ladder = make_ladder()
+    jobs = [{'id': job_id} for job_id in range(1, 8)]
+
+    recommendations = ladder._fallback({'skill_ids': [1]}, jobs, 3)
+
+    assert [rec['job']['id'] for rec in recommendations] == [1, 2, 3]
+    assert all(rec['similarity_score'] == 0.0 for rec in recommendations)
+
+def test_fallback_prefers_cached_then_popular_jobs():
+    ladder = make_ladder()
+    jobs = [{'id': job_id} for job_id in range(1, 8)]
+    employee = {'skill_ids': [1]}
+
+    # Job 99 is no longer in the catalogue and is skipped
+    ladder._remember(employee, [
+        {'job': {'id': 5}, 'similarity_score': 0.9},
+        {'job': {'id': 99}, 'similarity_score': 0.8}
+    ])
+    cached = ladder._fallback(employee, jobs, 3)
+    assert [(rec['job']['id'], rec['similarity_score']) for rec in cached] == [(5, 0.9), (1, 0.0), (2, 0.0)]
+
+    popular = ladder._fallback({'skill_ids': [2]}, jobs, 3)
+    assert [rec['job']['id'] for rec in popular] == [5, 1, 2]
+
+def test_popular_counter_is_bounded():
+    ladder = make_ladder(popular_size=10)
+
+    for employee_id in range(100):
+        ladder._remember({'id': employee_id}, [{'job': {'id': employee_id}, 'similarity_score': 0.5}])
+
+    assert len(ladder._popular) <= 20
+
+@pytest.mark.parametrize('path', ['exact', 'candidate_pool', 'approximate', 'fallback'])
+def test_recommend_clamps_k_to_small_catalogues(path):
+    rng = random.Random(0)
+    jobs = [random_job(rng, job_id) for job_id in range(1, 4)]
+
+    recommendations, taken = make_ladder().recommend(random_employee(rng), jobs, k=5, path=path)
+
+    assert taken == path
+    assert sorted(rec['job']['id'] for rec in recommendations) == [1, 2, 3]
+
+def test_recommend_empty_catalogue():
+    assert make_ladder().recommend({'skill_ids': [1]}, [], k=5) == ([], 'exact')
+
+@pytest.mark.parametrize('seed', range(5))
+def test_prefilter_matches_reference(seed):
+    rng = random.Random(seed)
+    jobs = [random_job(rng, job_id) for job_id in range(500)]
+    # Some jobs lack skills or career goal attributes entirely
+    for job in jobs[::7]:
+        job.pop('skill_ids')
+        job.pop('industry_id')
+    employee = random_employee(rng)
+
+    employee_skills = set(employee['skill_ids'])
+    goals = [(feature, employee[feature]) for feature in ('industry_id', 'position_id', 'job_type_id') if feature in employee]
+
+    def affinity(job):
+        return (
+            len(employee_skills.intersection(job.get('skill_ids', ()))) +
+            sum(1 for feature, value in goals if job.get(feature) == value)
+        )
+
+    assert make_ladder()._prefilter(employee, jobs, 50) == heapq.nlargest(50, jobs, key=affinity)
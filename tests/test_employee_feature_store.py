@@ -0,0 +1,56 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, delete, insert, inspect
+from sqlalchemy.orm import sessionmaker
+
+from app.models import EmployeeFeature
+from app.utils.employee_feature_store import EmployeeFeatureStore
+
+def feature_row(employee_id, refreshed_at=datetime(2024, 1, 1)):
+    return {
+        'employee_id': employee_id,
+        'job_type_id': 1,
+        'min_salary': 1000,
+        'skill_ids': [1, 2],
+        'education_level_ids': [],
+        'refreshed_at': refreshed_at
+    }
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'store.db'}")
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+def test_first_sync_creates_missing_table(session_factory):
+    store = EmployeeFeatureStore(session_factory)
+
+    assert store.sync() == 0
+    assert len(store) == 0
+    assert inspect(session_factory.kw['bind']).has_table('employee_feature')
+
+def test_sync_loads_updates_and_drops_rows(session_factory):
+    store = EmployeeFeatureStore(session_factory)
+    store.sync()
+
+    with session_factory() as db:
+        db.execute(insert(EmployeeFeature), [feature_row(1), feature_row(2)])
+        db.commit()
+    store.sync()
+
+    assert store.get(1) == {'id': 1, 'job_type_id': 1, 'min_salary': 1000, 'skill_ids': [1, 2]}
+    assert store.get(3) is None
+
+    with session_factory() as db:
+        db.execute(delete(EmployeeFeature).where(EmployeeFeature.employee_id.in_([1, 2])))
+        db.execute(insert(EmployeeFeature), [
+            {**feature_row(2, datetime(2024, 1, 2)), 'min_salary': 1500},
+            feature_row(3, datetime(2024, 1, 2))
+        ])
+        db.commit()
+    store.sync()
+
+    assert store.get(1) is None
+    assert store.get(2)['min_salary'] == 1500
+    assert len(store) == 2
@@ -0,0 +1,42 @@
+import random
+
+import pytest
+
+from app.utils.employee_index import EmployeeIndex
+from app.utils.job_recommender import JobRecommender
+from test_job_matrix import random_employee, random_job
+
+@pytest.mark.parametrize('seed', [0, 1, 2, 3, 4])
+def test_score_matches_job_recommender(seed):
+    rng = random.Random(seed)
+    employees = [random_employee(rng, employee_id) for employee_id in range(1, 101)]
+    jobs = [random_job(rng, job_id) for job_id in range(1, 21)]
+
+    index = EmployeeIndex(employees)
+
+    for job in jobs:
+        _, skill_match, salary_compatibility = index.score(job)
+
+        for row, employee in enumerate(employees):
+            recommender = JobRecommender(employee, [job])
+            assert skill_match[row] == pytest.approx(
+                recommender.calculate_skill_match(job.get('skill_ids', [])), abs=1e-9
+            )
+            assert salary_compatibility[row] == pytest.approx(
+                recommender.calculate_salary_compatibility(job), abs=1e-9
+            )
+
+def test_top_candidates_ranking():
+    rng = random.Random(5)
+    employees = [random_employee(rng, employee_id) for employee_id in range(1, 51)]
+    job = random_job(rng, 1)
+
+    index = EmployeeIndex(employees)
+    candidates = index.top_candidates(job, k=10)
+
+    scores = [candidate['similarity_score'] for candidate in candidates]
+    assert len(candidates) == 10
+    assert scores == sorted(scores, reverse=True)
+    assert len(index.top_candidates(job, k=500)) == 50
+    assert index.top_candidates(job, k=0) == []
+    assert EmployeeIndex([]).top_candidates(job, k=10) == []
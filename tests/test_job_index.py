@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+import app.utils.job_index as job_index
+from app.utils.job_index import JobIndex, precision_report
+
+def random_catalogue(seed, n_jobs=1003, n_features=10, n_queries=20):
+    rng = np.random.default_rng(seed)
+    features = rng.standard_normal((n_jobs, n_features))
+    # Queries outside the catalogue, like employees with raw salary expectations
+    queries = rng.standard_normal((n_queries, n_features)) * 3
+    return features, queries
+
+@pytest.mark.parametrize('block_rows', [1, 64, 1000, 1003, 5000])
+def test_int8_blocked_keys_match_unblocked(monkeypatch, block_rows):
+    features, queries = random_catalogue(0)
+    index = JobIndex(features, 'int8')
+
+    expected_distances, expected_indices = index.kneighbors(queries, 10)
+
+    monkeypatch.setattr(job_index, 'INT8_BLOCK_ROWS', block_rows)
+    distances, indices = index.kneighbors(queries, 10)
+
+    np.testing.assert_array_equal(indices, expected_indices)
+    np.testing.assert_allclose(distances, expected_distances, rtol=1e-5)
+
+@pytest.mark.parametrize('precision, min_overlap', [('float32', 0.99), ('int8', 0.9)])
+def test_reduced_precision_overlap_with_float64(precision, min_overlap):
+    features, queries = random_catalogue(1)
+
+    report = precision_report(features, queries, k=10, precisions=(precision,))
+
+    assert report[precision]['topKOverlap'] >= min_overlap
+
+def test_float32_distances_match_float64():
+    features, queries = random_catalogue(2)
+
+    expected_distances, expected_indices = JobIndex(features, 'float64').kneighbors(queries, 5)
+    distances, indices = JobIndex(features, 'float32').kneighbors(queries, 5)
+
+    np.testing.assert_array_equal(indices, expected_indices)
+    np.testing.assert_allclose(distances, expected_distances, rtol=1e-4)
+
+def test_precision_report_times_build_and_query_separately():
+    features, queries = random_catalogue(3, n_jobs=50, n_queries=2)
+
+    report = precision_report(features, queries, k=3)
+
+    for result in report.values():
+        assert result['buildMs'] >= 0
+        assert result['queryMs'] >= 0
+
+def test_too_many_neighbours():
+    features, queries = random_catalogue(4, n_jobs=3, n_queries=1)
+
+    for precision in job_index.PRECISIONS:
+        with pytest.raises(ValueError):
+            JobIndex(features, precision).kneighbors(queries, 4)
@@ -0,0 +1,70 @@
+import random
+
+import pytest
+
+import app.utils.job_matrix as job_matrix
+from app.utils.job_matrix import JobMatrix
+from app.utils.job_recommender import JobRecommender
+
+def random_job(rng, job_id):
+    job = {'id': job_id}
+    for feature in job_matrix.STATIC_FEATURES:
+        if rng.random() < 0.9:
+            job[feature] = rng.randint(1, 6)
+    if rng.random() < 0.8:
+        job['min_salary'] = rng.randint(5, 20) * 100
+    if rng.random() < 0.8:
+        job['max_salary'] = job.get('min_salary', 500) + rng.randint(0, 20) * 100
+    skills = rng.sample(range(30), rng.randint(0, 5))
+    if skills:
+        job['skill_ids'] = skills
+    return job
+
+def random_employee(rng, employee_id):
+    employee = {'id': employee_id}
+    for feature in ('job_type_id', 'position_id', 'industry_id'):
+        if rng.random() < 0.8:
+            employee[feature] = rng.randint(1, 6)
+    if rng.random() < 0.8:
+        employee['min_salary'] = rng.randint(5, 20) * 100
+    if rng.random() < 0.8:
+        # Always wider than zero; the scalar recommender divides by the range width
+        employee['max_salary'] = employee.get('min_salary', 0) + rng.randint(1, 20) * 100
+    # Skills outside the catalogue vocabulary and duplicates are both allowed
+    skills = [rng.randint(0, 40) for _ in range(rng.randint(0, 6))]
+    if skills:
+        employee['skill_ids'] = skills
+    return employee
+
+def as_ranking(recommendations):
+    return [(rec['job']['id'], rec['similarity_score']) for rec in recommendations]
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+@pytest.mark.parametrize('max_block_cells', [job_matrix.MAX_BLOCK_CELLS, 1000])
+def test_recommend_batch_matches_job_recommender(monkeypatch, seed, max_block_cells):
+    monkeypatch.setattr(job_matrix, 'MAX_BLOCK_CELLS', max_block_cells)
+
+    rng = random.Random(seed)
+    jobs = [random_job(rng, job_id) for job_id in range(1, 201)]
+    employees = [random_employee(rng, employee_id) for employee_id in range(1, 61)]
+
+    batch = JobMatrix(jobs).recommend_batch(employees, k=10)
+
+    assert len(batch) == len(employees)
+    for employee, recommendations in zip(employees, batch):
+        expected = as_ranking(JobRecommender(employee, jobs).recommend_jobs(k=10))
+        found = as_ranking(recommendations)
+
+        assert [job_id for job_id, _ in found] == [job_id for job_id, _ in expected]
+        assert [score for _, score in found] == pytest.approx([score for _, score in expected], abs=1e-9)
+
+def test_recommend_batch_small_catalogue():
+    rng = random.Random(3)
+    jobs = [random_job(rng, job_id) for job_id in range(1, 4)]
+    employees = [random_employee(rng, employee_id) for employee_id in range(1, 4)]
+
+    batch = JobMatrix(jobs).recommend_batch(employees, k=10)
+
+    assert [len(recommendations) for recommendations in batch] == [3, 3, 3]
+    assert JobMatrix([]).recommend_batch(employees, k=10) == [[], [], []]
+    assert JobMatrix(jobs).recommend_batch([], k=10) == []
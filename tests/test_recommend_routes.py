@@ -0,0 +1,227 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+import app.utils.employee_feature_store as employee_feature_store
+import app.utils.employee_index as employee_index
+from app import create_app
+from app.config import Config
+from app.models import EmployeeFeature
+from app.routes.recommend_routes import flatten_employee_data
+
+JOBS = [
+    {
+        'id': job_id,
+        'jobType': {'id': job_id % 3 + 1},
+        'position': {'id': job_id % 4 + 1},
+        'minSalary': 1000 + job_id * 10,
+        'maxSalary': 2000 + job_id * 10,
+        'skill_ids': [job_id % 7, job_id % 5]
+    }
+    for job_id in range(1, 30)
+]
+
+EMPLOYEE = {
+    'careerGoal': {'jobTypeId': 1, 'minSalary': 1000, 'maxSalary': 3000},
+    'skillIds': [1, 2]
+}
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(Config, 'STARTUP_MODE', 'lazy')
+    monkeypatch.setattr(Config, 'RECOMMEND_BUDGET_MS', 0)
+    return create_app().test_client()
+
+def test_recommend(client):
+    response = client.post('/api/recommend', json={'employee': EMPLOYEE, 'jobs': JOBS})
+
+    assert response.status_code == 200
+    assert len(response.get_json()) == 4
+    assert response.headers['X-Recommendation-Path'] == 'exact'
+
+@pytest.mark.parametrize('budget', ['abc', '0', '-5', ''])
+def test_recommend_rejects_invalid_budget(client, budget):
+    response = client.post(
+        '/api/recommend',
+        json={'employee': EMPLOYEE, 'jobs': JOBS},
+        headers={'X-Latency-Budget-Ms': budget}
+    )
+
+    assert response.status_code == 400
+    assert response.headers['X-Recommendation-Path'] == 'none'
+
+def test_recommend_within_budget(client):
+    response = client.post(
+        '/api/recommend',
+        json={'employee': EMPLOYEE, 'jobs': JOBS},
+        headers={'X-Latency-Budget-Ms': '60000'}
+    )
+
+    assert response.status_code == 200
+    assert response.headers['X-Recommendation-Path'] == 'exact'
+
+def test_recommend_over_budget_falls_back(client):
+    response = client.post(
+        '/api/recommend',
+        json={'employee': EMPLOYEE, 'jobs': JOBS},
+        headers={'X-Latency-Budget-Ms': '0.000001'}
+    )
+
+    assert response.status_code == 200
+    assert response.headers['X-Recommendation-Path'] == 'fallback'
+    assert len(response.get_json()) == 4
+
+def test_recommend_small_catalogue(client):
+    response = client.post('/api/recommend', json={'employee': EMPLOYEE, 'jobs': JOBS[:2]})
+
+    assert response.status_code == 200
+    assert len(response.get_json()) == 2
+
+@pytest.mark.parametrize('kwargs', [
+    {'data': '{bad', 'content_type': 'application/json'},
+    {'data': 'jobs', 'content_type': 'text/plain'},
+    {'json': [1, 2]},
+    {'json': {'jobs': JOBS}}
+])
+def test_recommend_rejects_invalid_input(client, kwargs):
+    response = client.post('/api/recommend', **kwargs)
+
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'Invalid input'}
+
+EMPLOYEES = [
+    {
+        'id': employee_id,
+        'careerGoal': {'jobTypeId': employee_id % 3 + 1, 'minSalary': 1000, 'maxSalary': 3000},
+        'skillIds': [employee_id % 7]
+    }
+    for employee_id in range(1, 16)
+]
+
+def test_candidates(client):
+    response = client.post('/api/candidates', json={'job': JOBS[0], 'employees': EMPLOYEES, 'k': 5})
+
+    assert response.status_code == 200
+    scores = [candidate['similarityScore'] for candidate in response.get_json()]
+    assert len(scores) == 5
+    assert scores == sorted(scores, reverse=True)
+
+@pytest.mark.parametrize('k', ['abc', 0, -1, 1.5, True])
+def test_candidates_rejects_invalid_k(client, k):
+    response = client.post('/api/candidates', json={'job': JOBS[0], 'employees': EMPLOYEES, 'k': k})
+
+    assert response.status_code == 400
+
+@pytest.mark.parametrize('kwargs', [
+    {'data': '{bad', 'content_type': 'application/json'},
+    {'json': [1, 2]},
+    {'json': {'employees': EMPLOYEES}},
+    {'json': {'job': JOBS[0], 'employees': {'id': 1}}}
+])
+def test_candidates_rejects_invalid_input(client, kwargs):
+    response = client.post('/api/candidates', **kwargs)
+
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'Invalid input'}
+
+def test_candidates_without_database(client, monkeypatch):
+    monkeypatch.setattr(Config, 'DATABASE_URL', None)
+
+    response = client.post('/api/candidates', json={'job': JOBS[0]})
+
+    assert response.status_code == 501
+
+def test_candidates_while_index_loads(client, monkeypatch):
+    monkeypatch.setattr(Config, 'DATABASE_URL', 'sqlite://')
+    monkeypatch.setattr(employee_index, 'get_database_employee_index', lambda ttl_seconds: None)
+
+    response = client.post('/api/candidates', json={'job': JOBS[0]})
+
+    assert response.status_code == 503
+
+def test_candidates_from_database_index(client, monkeypatch):
+    index = employee_index.EmployeeIndex([flatten_employee_data(employee) for employee in EMPLOYEES])
+    monkeypatch.setattr(Config, 'DATABASE_URL', 'sqlite://')
+    monkeypatch.setattr(employee_index, 'get_database_employee_index', lambda ttl_seconds: index)
+
+    response = client.post('/api/candidates', json={'job': JOBS[0], 'k': 3})
+
+    assert response.status_code == 200
+    assert len(response.get_json()) == 3
+
+@pytest.fixture
+def feature_store(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'store.db'}")
+    store = employee_feature_store.EmployeeFeatureStore(sessionmaker(bind=engine))
+
+    monkeypatch.setattr(Config, 'DATABASE_URL', 'sqlite://')
+    monkeypatch.setattr(employee_feature_store, 'get_employee_feature_store', lambda: store)
+
+    yield store
+
+    engine.dispose()
+
+def materialize(store, employee_ids):
+    with store.session_factory() as db:
+        EmployeeFeature.__table__.create(bind=db.connection(), checkfirst=True)
+        db.execute(insert(EmployeeFeature), [
+            {
+                'employee_id': employee_id,
+                'job_type_id': 1,
+                'min_salary': 1000,
+                'max_salary': 3000,
+                'skill_ids': [1, 2],
+                'refreshed_at': datetime(2024, 1, 1)
+            }
+            for employee_id in employee_ids
+        ])
+        db.commit()
+    store.refresh()
+
+@pytest.mark.parametrize('employee_id', [2, '2'])
+def test_recommend_by_employee_id(client, feature_store, employee_id):
+    materialize(feature_store, [1, 2])
+
+    response = client.post('/api/recommend', json={'employeeId': employee_id, 'jobs': JOBS})
+    expected = client.post('/api/recommend', json={'employee': EMPLOYEE, 'jobs': JOBS})
+
+    assert response.status_code == 200
+    assert response.get_json() == expected.get_json()
+
+@pytest.mark.parametrize('employee_id', ['abc', 0, None])
+def test_recommend_rejects_invalid_employee_id(client, feature_store, employee_id):
+    materialize(feature_store, [1])
+
+    response = client.post('/api/recommend', json={'employeeId': employee_id, 'jobs': JOBS})
+
+    assert response.status_code == 400
+
+def test_recommend_unknown_employee_id(client, feature_store):
+    materialize(feature_store, [1])
+
+    response = client.post('/api/recommend', json={'employeeId': 99, 'jobs': JOBS})
+
+    assert response.status_code == 404
+
+def test_recommend_employee_id_while_store_loads(client, feature_store):
+    response = client.post('/api/recommend', json={'employeeId': 1, 'jobs': JOBS})
+
+    assert response.status_code == 503
+    assert 'loading' in response.get_json()['error']
+
+def test_recommend_employee_id_before_first_refresh(client, feature_store):
+    feature_store.refresh()
+
+    response = client.post('/api/recommend', json={'employeeId': 1, 'jobs': JOBS})
+
+    assert response.status_code == 503
+    assert 'refresh_employee_features' in response.get_json()['error']
+
+def test_recommend_employee_id_without_database(client, monkeypatch):
+    monkeypatch.setattr(Config, 'DATABASE_URL', None)
+
+    response = client.post('/api/recommend', json={'employeeId': 1, 'jobs': JOBS})
+
+    assert response.status_code == 501
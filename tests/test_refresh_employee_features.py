@@ -0,0 +1,147 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, delete, insert, select, update
+from sqlalchemy.orm import sessionmaker
+
+import app.jobs.refresh_employee_features as refresh_employee_features
+from app.jobs.refresh_employee_features import full_refresh, incremental_refresh, stale_employee_ids
+from app.models import CareerGoal, Education, Employee, EmployeeFeature, EmployeeSkill
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    # Rows at the watermark are re-scanned within the overlap; without it counts are exact
+    monkeypatch.setattr(refresh_employee_features, 'WATERMARK_OVERLAP', timedelta(0))
+
+    # The model tables with stand-ins for the referenced tables this service has no model for
+    metadata = MetaData()
+    for name in ('user', 'skill', 'education_level'):
+        Table(name, metadata, Column('id', Integer, primary_key=True))
+    for model in (CareerGoal, Employee, EmployeeSkill, Education, EmployeeFeature):
+        model.__table__.to_metadata(metadata)
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'features.db'}")
+    metadata.create_all(engine)
+
+    session = sessionmaker(bind=engine)()
+    for employee_id in (1, 2, 3):
+        session.execute(insert(CareerGoal).values(
+            id=employee_id, industry_id=employee_id, job_type_id=1, position_id=2,
+            min_salary=1000, max_salary=2000
+        ))
+        session.execute(insert(Employee).values(id=employee_id, career_goal_id=employee_id))
+        session.execute(insert(EmployeeSkill).values([
+            {'employee_id': employee_id, 'skill_id': skill_id} for skill_id in (10, 20, 30)
+        ]))
+    session.execute(insert(Education).values(employee_id=1, education_level_id=4))
+
+    # Older than anything written by the tests
+    session.execute(update(CareerGoal).values(updated_at=datetime(2020, 1, 1)))
+    session.execute(update(EmployeeSkill).values(updated_at=datetime(2020, 1, 1)))
+    session.commit()
+
+    yield session
+
+    session.close()
+    engine.dispose()
+
+def stored(db):
+    return {row.employee_id: row.as_features() for row in db.scalars(select(EmployeeFeature))}
+
+def test_first_incremental_run_materializes_everything(db):
+    assert incremental_refresh(db) == 3
+
+    features = stored(db)
+    assert sorted(features) == [1, 2, 3]
+    assert features[1]['skill_ids'] == [10, 20, 30]
+    assert features[1]['education_level_ids'] == [4]
+    assert features[2]['industry_id'] == 2
+    assert stale_employee_ids(db) == []
+
+def test_unchanged_store_is_up_to_date(db):
+    full_refresh(db)
+
+    assert stale_employee_ids(db) == []
+    assert incremental_refresh(db) == 0
+
+def test_skill_deletion(db):
+    full_refresh(db)
+
+    # A delete leaves no updated_at behind
+    db.execute(delete(EmployeeSkill).where(EmployeeSkill.employee_id == 2, EmployeeSkill.skill_id == 20))
+    db.commit()
+
+    assert stale_employee_ids(db) == [2]
+    assert incremental_refresh(db) == 1
+
+    assert stored(db)[2]['skill_ids'] == [10, 30]
+    assert stale_employee_ids(db) == []
+
+def test_last_skill_deletion(db):
+    full_refresh(db)
+
+    db.execute(delete(EmployeeSkill).where(EmployeeSkill.employee_id == 3))
+    db.commit()
+    incremental_refresh(db)
+
+    assert 'skill_ids' not in stored(db)[3]
+
+def test_career_goal_repointed(db):
+    full_refresh(db)
+
+    # Pointing at an existing goal touches only employee, which has no updated_at
+    db.execute(update(Employee).where(Employee.id == 1).values(career_goal_id=3))
+    db.commit()
+    assert incremental_refresh(db) == 1
+
+    assert stored(db)[1]['industry_id'] == 3
+
+def test_career_goal_removed(db):
+    full_refresh(db)
+
+    db.execute(update(Employee).where(Employee.id == 2).values(career_goal_id=None))
+    db.commit()
+    assert incremental_refresh(db) == 1
+
+    assert stored(db)[2] == {'id': 2, 'skill_ids': [10, 20, 30]}
+
+def test_career_goal_updated(db):
+    full_refresh(db)
+
+    db.execute(update(CareerGoal).where(CareerGoal.id == 2).values(min_salary=1500))
+    db.commit()
+    assert incremental_refresh(db) == 1
+
+    assert stored(db)[2]['min_salary'] == 1500
+
+def test_skill_swap_with_same_aggregate(db):
+    full_refresh(db)
+
+    # Same count and sum; caught by the inserted rows' updated_at instead
+    db.execute(delete(EmployeeSkill).where(EmployeeSkill.employee_id == 1, EmployeeSkill.skill_id.in_([10, 30])))
+    db.execute(insert(EmployeeSkill).values([{'employee_id': 1, 'skill_id': 15}, {'employee_id': 1, 'skill_id': 25}]))
+    db.commit()
+    assert stale_employee_ids(db) == []
+    assert incremental_refresh(db) == 1
+
+    assert sorted(stored(db)[1]['skill_ids']) == [15, 20, 25]
+
+def test_new_and_removed_employees(db):
+    full_refresh(db)
+
+    db.execute(insert(Employee).values(id=4))
+    db.execute(delete(EmployeeSkill).where(EmployeeSkill.employee_id == 3))
+    db.execute(delete(Employee).where(Employee.id == 3))
+    db.commit()
+    incremental_refresh(db)
+
+    assert sorted(stored(db)) == [1, 2, 4]
+
+def test_watermark_falls_back_to_refreshed_at(db):
+    # Source rows without an updated_at must not force a full rebuild on every pass
+    db.execute(update(CareerGoal).values(updated_at=None))
+    db.execute(update(EmployeeSkill).values(updated_at=None))
+    db.commit()
+    full_refresh(db)
+
+    assert incremental_refresh(db) == 0